@@ -1,10 +1,37 @@
+import functools
 from enum import Enum
 from dataclasses import dataclass
 from typing import Dict, Any
 import re
-from core.nlp_utils import extract_quantity, all_menu_items, similarity
+from core.keyword_matcher import build_keyword_matcher
+from core.nlp_utils import extract_quantity, similarity, MENU_NAMES_LOWER
 from core.restaurant_data import REST_DATA
 
+# Distinct (utterance, pending confirmation) pairs whose routing is memoized;
+# short replies ("yes", "menu", "my order") repeat a lot
+ROUTE_CACHE_SIZE = 256
+
+# Words that confirm a pending order when they open the reply
+_CONFIRM_WORDS_START = ["yes", "yeah", "yep", "sure", "okay", "ok", "confirm", "correct", "please", "add it", "go ahead"]
+# Matches iff the text starts with one of _CONFIRM_WORDS_START (str.startswith semantics)
+_CONFIRM_START_RE = re.compile("|".join(re.escape(w) for w in _CONFIRM_WORDS_START))
+# Tokens that reject a pending order when among the first two words
+_REJECT_WORDS = frozenset(["no", "nope", "nah", "cancel", "don't", "not", "stop", "wait"])
+
+# "What's in <category>" style queries; group 1 is the category phrase
+_WHATS_IN_RES = [re.compile(p) for p in (
+    r"what['\s]*s\s+in\s+([a-z\s]+)(?:\?|$)",
+    r"what\s+is\s+in\s+([a-z\s]+)(?:\?|$)",
+    r"what\s+does\s+([a-z\s]+)\s+have(?:\?|$)",
+    r"what\s+are\s+the\s+items\s+in\s+([a-z\s]+)(?:\?|$)",
+    r"show\s+me\s+([a-z\s]+)\s+items(?:\?|$)",
+    r"items\s+in\s+([a-z\s]+)(?:\?|$)",
+    r"dishes\s+in\s+([a-z\s]+)(?:\?|$)",
+)]
+# Quantity + item phrase, e.g. "2 cold coffee", "three garlic naan", "another two"
+_QUANTITY_ITEM_RE = re.compile(r'\b(\d+|one|two|three|four|five|six|seven|eight|nine|ten|another|more|additional|extra)\s+([a-z\s]+)\b')
+
+
 # ========== INTENT CLASSIFICATION ==========
 class Intent(Enum):
     """Intent types for deterministic routing"""
@@ -85,19 +112,78 @@ class IntentRouter:
             "check bill", "my bill", "generate bill", "final bill"
         ]
         
+        # Every keyword list route() checks, scanned in a single pass per utterance
+        # (built here, so later edits to the pattern lists are not picked up)
+        self._match = build_keyword_matcher({
+            "confirm_word": _CONFIRM_WORDS_START,
+            "denial": ["no", "not", "don't"],
+            "veg": [
+                "vegetarian", "veg option", "veg dish", "veg food",
+                "vegetable dish", "veg item", "do you have veg", "any veg",
+                "vegetarian option", "vegetarian dish", "veg items",
+                "vegetarian food", "veg food", "any vegetarian"
+            ],
+            "finalize": self.finalize_patterns,
+            "billing": self.billing_patterns,
+            "update": [
+                "update", "change", "modify", "make it", "change to",
+                "set to", "adjust", "edit", "alter", "only want", "want only",
+                "update my order", "change my order"
+            ],
+            "remove": [
+                "remove", "delete", "cancel", "without", "don't add",
+                "take out", "get rid of", "eliminate", "remove from my order",
+                "delete from my order", "cancel from my order"
+            ],
+            "greeting": self.greeting_patterns,
+            "request": self.price_patterns + self.add_patterns + self.update_patterns + self.remove_patterns,
+            "audibility": self.audibility_patterns,
+            "thanks": self.thanks_patterns,
+            "summary": ["my order", "cart", "summary", "what i have", "what's in my order",
+                        "order summary", "current order", "show order"],
+            "clear": ["clear order", "reset order", "cancel all", "start over", "empty order"],
+            "price": self.price_patterns,
+            "menu": self.menu_patterns,
+            "describe": ["what is", "tell me about", "describe", "what's", "what does"],
+            "category_word": ["course", "menu", "category", "section", "beverage", "drink", "starter", "dessert"],
+            "add": self.add_patterns + ["add", "want", "need", "like", "get", "give", "order",
+                                        "another", "more", "additional", "extra"],
+            "restaurant_info": ["address", "location", "phone", "contact", "restaurant name", "your name"],
+            "number_word": ["one", "two", "three", "four", "five"],
+            "not_dish": ["hello", "hi", "thanks", "thank", "okay", "yes", "no"],
+            "goodbye": ["bye", "goodbye", "see you", "farewell"],
+        })
+        # Per-instance memo of _route; routing depends only on the text and the menu
+        self._route_cached = functools.lru_cache(maxsize=ROUTE_CACHE_SIZE)(self._route)
+    
+    def clear_cache(self) -> None:
+        """Drop memoized routing results (e.g. after REST_DATA is reloaded)"""
+        self._route_cached.cache_clear()
+    
     def route(self, text: str, has_pending_confirmation: bool = False) -> IntentResult:
+        """Route intent with deterministic rules first, memoized per utterance"""
+        cached = self._route_cached(text, bool(has_pending_confirmation))
+        # Callers own the returned result; never hand out the cached slots dict
+        return IntentResult(
+            intent=cached.intent,
+            confidence=cached.confidence,
+            slots=dict(cached.slots),
+            requires_confirmation=cached.requires_confirmation
+        )
+    
+    def _route(self, text: str, has_pending_confirmation: bool) -> IntentResult:
         """Route intent with deterministic rules first - FIXED VERSION"""
         text_low = text.lower().strip()
+        matched = self._match(text_low)
+        words = text_low.split()
         
         # PRIORITY 1: Order confirmation (when there's a pending confirmation)
         if has_pending_confirmation:
-            # Check for confirmation words at the START of the sentence
-            confirm_words_start = ["yes", "yeah", "yep", "sure", "okay", "ok", "confirm", "correct", "please", "add it", "go ahead"]
             # Also check for affirmative patterns within the first few words
-            first_words = " ".join(text_low.split()[:3])  # Look at first 3 words
+            first_words = " ".join(words[:3])  # Look at first 3 words
             
             # Check if it starts with a confirmation
-            if any(first_words.startswith(word) for word in confirm_words_start):
+            if _CONFIRM_START_RE.match(first_words):
                 return IntentResult(
                     intent=Intent.ORDER_CONFIRM,
                     confidence=1.0,
@@ -105,9 +191,9 @@ class IntentRouter:
                 )
             
             # Also check if any confirmation word appears prominently
-            if any(word in text_low for word in confirm_words_start):
+            if "confirm_word" in matched:
                 # But make sure it's not a denial pattern like "yes, but remove..."
-                if "no" not in text_low and "not" not in text_low and "don't" not in text_low:
+                if "denial" not in matched:
                     return IntentResult(
                         intent=Intent.ORDER_CONFIRM,
                         confidence=0.9,
@@ -115,8 +201,7 @@ class IntentRouter:
                     )
             
             # Check for rejection words
-            reject_words = ["no", "nope", "nah", "cancel", "don't", "not", "stop", "wait"]
-            if any(word in text_low.split()[:2] for word in reject_words):
+            if not _REJECT_WORDS.isdisjoint(words[:2]):
                 return IntentResult(
                     intent=Intent.ORDER_CONFIRM,
                     confidence=1.0,
@@ -124,13 +209,7 @@ class IntentRouter:
                 )
         
         # 2. VEGETARIAN OPTIONS - MUST COME BEFORE MENU AND ORDER ADD
-        veg_keywords = [
-            "vegetarian", "veg option", "veg dish", "veg food", 
-            "vegetable dish", "veg item", "do you have veg", "any veg",
-            "vegetarian option", "vegetarian dish", "veg items",
-            "vegetarian food", "veg food", "any vegetarian"
-        ]
-        if any(kw in text_low for kw in veg_keywords):
+        if "veg" in matched:
             return IntentResult(
                 intent=Intent.VEGETARIAN_OPTIONS,
                 confidence=0.95,
@@ -138,7 +217,7 @@ class IntentRouter:
             )
         
         # 3. Order finalize (place order)
-        if any(pattern in text_low for pattern in self.finalize_patterns):
+        if "finalize" in matched:
             return IntentResult(
                 intent=Intent.ORDER_FINALIZE,
                 confidence=0.95,
@@ -146,7 +225,7 @@ class IntentRouter:
             )
         
         # 4. Billing request
-        if any(pattern in text_low for pattern in self.billing_patterns):
+        if "billing" in matched:
             return IntentResult(
                 intent=Intent.ORDER_BILLING,
                 confidence=0.95,
@@ -154,12 +233,7 @@ class IntentRouter:
             )
         
         # 5. Order update (change quantity) - MUST COME BEFORE SUMMARY
-        update_keywords = [
-            "update", "change", "modify", "make it", "change to",
-            "set to", "adjust", "edit", "alter", "only want", "want only",
-            "update my order", "change my order"
-        ]
-        if any(kw in text_low for kw in update_keywords):
+        if "update" in matched:
             return IntentResult(
                 intent=Intent.ORDER_UPDATE,
                 confidence=0.9,
@@ -167,12 +241,7 @@ class IntentRouter:
             )
         
         # 6. Order remove - MUST COME BEFORE SUMMARY
-        remove_keywords = [
-            "remove", "delete", "cancel", "without", "don't add",
-            "take out", "get rid of", "eliminate", "remove from my order",
-            "delete from my order", "cancel from my order"
-        ]
-        if any(kw in text_low for kw in remove_keywords):
+        if "remove" in matched:
             return IntentResult(
                 intent=Intent.ORDER_REMOVE,
                 confidence=0.9,
@@ -180,9 +249,9 @@ class IntentRouter:
             )
         
         # 7. Small talk - Greeting
-        if any(pattern in text_low for pattern in self.greeting_patterns):
+        if "greeting" in matched:
             # Check if it's combined with a request
-            if any(p in text_low for p in self.price_patterns + self.add_patterns + self.update_patterns + self.remove_patterns):
+            if "request" in matched:
                 pass  # Fall through to detect the actual intent
             else:
                 return IntentResult(
@@ -192,7 +261,7 @@ class IntentRouter:
                 )
         
         # 8. Small talk - Audibility
-        if any(pattern in text_low for pattern in self.audibility_patterns):
+        if "audibility" in matched:
             return IntentResult(
                 intent=Intent.SMALL_TALK_AUDIBILITY,
                 confidence=1.0,
@@ -200,9 +269,9 @@ class IntentRouter:
             )
         
         # 9. Small talk - Thanks
-        if any(pattern in text_low for pattern in self.thanks_patterns):
+        if "thanks" in matched:
             # Ensure it's not part of a longer sentence asking for something
-            if len(text_low.split()) <= 3:
+            if len(words) <= 3:
                 return IntentResult(
                     intent=Intent.SMALL_TALK_THANKS,
                     confidence=1.0,
@@ -210,9 +279,7 @@ class IntentRouter:
                 )
         
         # 10. Order summary - MORE SPECIFIC
-        summary_keywords = ["my order", "cart", "summary", "what i have", "what's in my order", 
-                          "order summary", "current order", "show order"]
-        if any(p in text_low for p in summary_keywords):
+        if "summary" in matched:
             return IntentResult(
                 intent=Intent.ORDER_SUMMARY,
                 confidence=0.95,
@@ -220,7 +287,7 @@ class IntentRouter:
             )
         
         # 11. Order clear
-        if any(p in text_low for p in ["clear order", "reset order", "cancel all", "start over", "empty order"]):
+        if "clear" in matched:
             return IntentResult(
                 intent=Intent.ORDER_CLEAR,
                 confidence=1.0,
@@ -228,7 +295,7 @@ class IntentRouter:
             )
         
         # 12. Info - Price (HIGH PRIORITY)
-        if any(pattern in text_low for pattern in self.price_patterns):
+        if "price" in matched:
             return IntentResult(
                 intent=Intent.INFO_PRICE,
                 confidence=0.95,
@@ -236,7 +303,7 @@ class IntentRouter:
             )
         
         # 13. Info - Menu
-        if any(pattern in text_low for pattern in self.menu_patterns):
+        if "menu" in matched:
             return IntentResult(
                 intent=Intent.INFO_MENU,
                 confidence=0.95,
@@ -244,18 +311,8 @@ class IntentRouter:
             )
         
         # 14. Check for "what's in [category]" queries - MUST COME BEFORE INFO_DESCRIPTION
-        whats_in_patterns = [
-            r"what['\s]*s\s+in\s+([a-z\s]+)(?:\?|$)",
-            r"what\s+is\s+in\s+([a-z\s]+)(?:\?|$)",
-            r"what\s+does\s+([a-z\s]+)\s+have(?:\?|$)",
-            r"what\s+are\s+the\s+items\s+in\s+([a-z\s]+)(?:\?|$)",
-            r"show\s+me\s+([a-z\s]+)\s+items(?:\?|$)",
-            r"items\s+in\s+([a-z\s]+)(?:\?|$)",
-            r"dishes\s+in\s+([a-z\s]+)(?:\?|$)"
-        ]
-        
-        for pattern in whats_in_patterns:
-            match = re.search(pattern, text_low)
+        for pattern in _WHATS_IN_RES:
+            match = pattern.search(text_low)
             if match:
                 category_name = match.group(1).strip()
                 # Check if it matches any category in the menu
@@ -273,10 +330,9 @@ class IntentRouter:
                         )
         
         # 15. Info - Description (for individual dishes)
-        if any(k in text_low for k in ["what is", "tell me about", "describe", "what's", "what does"]):
+        if "describe" in matched:
             # But make sure it's not asking about a category
-            category_words = ["course", "menu", "category", "section", "beverage", "drink", "starter", "dessert"]
-            if not any(word in text_low for word in category_words):
+            if "category_word" not in matched:
                 return IntentResult(
                     intent=Intent.INFO_DESCRIPTION,
                     confidence=0.9,
@@ -284,12 +340,8 @@ class IntentRouter:
                 )
         
         # 16. Order - Add (requires quantity extraction) - IMPROVED
-        add_keywords = self.add_patterns + ["add", "want", "need", "like", "get", "give", "order", 
-                                          "another", "more", "additional", "extra"]
-        
         # Check for quantity patterns first (e.g., "2 cold coffee", "three garlic naan", "another two")
-        quantity_pattern = re.search(r'\b(\d+|one|two|three|four|five|six|seven|eight|nine|ten|another|more|additional|extra)\s+([a-z\s]+)\b', text_low)
-        if quantity_pattern:
+        if _QUANTITY_ITEM_RE.search(text_low):
             qty = extract_quantity(text_low)
             return IntentResult(
                 intent=Intent.ORDER_ADD,
@@ -299,7 +351,7 @@ class IntentRouter:
             )
         
         # Then check for add keywords
-        if any(pattern in text_low for pattern in add_keywords):
+        if "add" in matched:
             qty = extract_quantity(text_low)
             return IntentResult(
                 intent=Intent.ORDER_ADD,
@@ -309,7 +361,7 @@ class IntentRouter:
             )
         
         # 17. Restaurant info
-        if any(k in text_low for k in ["address", "location", "phone", "contact", "restaurant name", "your name"]):
+        if "restaurant_info" in matched:
             return IntentResult(
                 intent=Intent.RESTAURANT_INFO,
                 confidence=0.9,
@@ -318,22 +370,19 @@ class IntentRouter:
         
         # 18. Check for dish names with quantities (e.g., "cold coffee 2")
         # This catches patterns that weren't caught by the regex above
-        for cat, item in all_menu_items():
-            item_low = item["name"].lower()
-            if item_low in text_low:
-                # Check if there's a number in the text
-                if any(char.isdigit() for char in text_low) or any(word in text_low for word in ['one', 'two', 'three', 'four', 'five']):
-                    qty = extract_quantity(text_low)
-                    return IntentResult(
-                        intent=Intent.ORDER_ADD,
-                        confidence=0.8,
-                        slots={"text": text, "quantity": qty},
-                        requires_confirmation=True
-                    )
+        if any(item_low in text_low for item_low in MENU_NAMES_LOWER):
+            # Check if there's a number in the text
+            if any(char.isdigit() for char in text_low) or "number_word" in matched:
+                qty = extract_quantity(text_low)
+                return IntentResult(
+                    intent=Intent.ORDER_ADD,
+                    confidence=0.8,
+                    slots={"text": text, "quantity": qty},
+                    requires_confirmation=True
+                )
         
         # 19. Single word dish names (short queries)
-        words = text_low.split()
-        if len(words) <= 3 and not any(p in text_low for p in ["hello", "hi", "thanks", "thank", "okay", "yes", "no"]):
+        if len(words) <= 3 and "not_dish" not in matched:
             # Could be asking about a dish
             return IntentResult(
                 intent=Intent.INFO_DESCRIPTION,
@@ -350,7 +399,7 @@ class IntentRouter:
             )
         
         # 21. Check for goodbye phrases
-        if any(word in text_low for word in ["bye", "goodbye", "see you", "farewell"]):
+        if "goodbye" in matched:
             return IntentResult(
                 intent=Intent.SMALL_TALK_THANKS,
                 confidence=0.8,
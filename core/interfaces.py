@@ -26,6 +26,10 @@ class IMenuRepository(Protocol):
     def all_menu_items(self) -> Generator[Tuple[Dict, Dict], None, None]:
         """Generator for all menu items"""
         ...
+    
+    def version(self) -> int:
+        """Menu data version, bumped whenever the data is (re)loaded"""
+        ...
 
 
 @runtime_checkable
@@ -0,0 +1,50 @@
+"""
+Keyword group matching
+
+Compiles groups of keywords into a single regex scan with plain substring
+semantics: a group matches when any of its keywords occurs anywhere in the
+text, exactly like ``any(kw in text for kw in keywords)`` per group.
+"""
+import re
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable
+
+_NO_GROUPS: FrozenSet[Hashable] = frozenset()
+
+
+def build_keyword_matcher(groups: Dict[Hashable, Iterable[str]], flags: int = 0) -> Callable[[str], FrozenSet[Hashable]]:
+    """
+    Build a function returning every group with a keyword occurring in its input.
+
+    A longest-first zero-width scan reports only the longest keyword starting at
+    each position (overlapping occurrences included); any shorter keyword starting
+    there is a prefix of it, so every keyword maps to the groups of all its
+    prefixes as well.
+
+    Args:
+        groups: Group key (name, index, ...) -> keywords
+        flags: Extra regex flags; with re.IGNORECASE, keywords must be lowercase
+
+    Returns:
+        Function mapping text to the frozenset of matched group keys
+    """
+    groups = {group: tuple(kws) for group, kws in groups.items()}
+    keyword_groups = {}
+    for kw in {kw for kws in groups.values() for kw in kws}:
+        keyword_groups[kw] = frozenset(
+            group for group, kws in groups.items() if any(kw.startswith(k) for k in kws)
+        )
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(kw) for kw in sorted(keyword_groups, key=len, reverse=True)) + "))",
+        flags,
+    )
+    finditer = pattern.finditer
+
+    def match(text: str) -> FrozenSet[Hashable]:
+        matched = set()
+        for m in finditer(text):
+            keyword = m.group(1)
+            # A case-insensitive hit reports the text's casing, not the keyword's
+            matched |= keyword_groups.get(keyword) or keyword_groups.get(keyword.lower(), _NO_GROUPS)
+        return frozenset(matched)
+
+    return match
@@ -1,20 +1,57 @@
+import functools
 import re
 from typing import List, Tuple, Optional, Dict, Any
 from core.restaurant_data import REST_DATA
 
-def all_menu_items():
-    """Generator for all menu items"""
-    for cat in REST_DATA.get("menu", []):
-        for item in cat.get("items", []):
-            yield cat, item
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:  # Optional speedup; pure-Python DP is used otherwise
+    _Levenshtein = None
+
+try:
+    import numpy as np
+    from rapidfuzz.process import cdist as _cdist
+except ImportError:  # Optional; menu words are scored one pair at a time otherwise
+    _cdist = None
+
+# Memoized (normalized word, normalized word) similarity scores; menu words are
+# a small fixed set and transcripts reuse the same few hundred words
+SIMILARITY_CACHE_SIZE = 8192
 
 # ========== FUZZY MATCHING FUNCTIONS ==========
 def normalize(w: str) -> str:
     """Normalize word for matching"""
     return "".join(x for x in w.lower() if x.isalpha())
 
+# ========== MENU INDEX ==========
+# (category, item, normalized name words, name word count) for every menu item,
+# built once: REST_DATA is loaded at import and never modified
+MENU_INDEX: List[Tuple[Dict, Dict, Tuple[str, ...], int]] = [
+    (cat, item, tuple(normalize(w) for w in item["name"].split()), len(item["name"].split()))
+    for cat in REST_DATA.get("menu", [])
+    for item in cat.get("items", [])
+]
+_MENU_ITEMS: List[Tuple[Dict, Dict]] = [(cat, item) for cat, item, _, _ in MENU_INDEX]
+# Lowercased item names, in menu order, for substring checks against utterances
+MENU_NAMES_LOWER: Tuple[str, ...] = tuple(item["name"].lower() for _, item in _MENU_ITEMS)
+
+# Distinct non-empty normalized words across all dish names; each utterance scores
+# every text word against these once, then items look up their words' best scores
+MENU_WORDS: Tuple[str, ...] = tuple(sorted({w for _, _, words, _ in MENU_INDEX for w in words if w}))
+_MENU_WORD_POS = {w: i for i, w in enumerate(MENU_WORDS)}
+# Per MENU_INDEX entry: positions in MENU_WORDS of its distinct non-empty name words
+_MENU_ITEM_WORD_POS: List[Tuple[int, ...]] = [
+    tuple(_MENU_WORD_POS[w] for w in dict.fromkeys(words) if w) for _, _, words, _ in MENU_INDEX
+]
+
+def all_menu_items():
+    """Iterator over all (category, item) pairs"""
+    return iter(_MENU_ITEMS)
+
 def edit_dist(a: str, b: str) -> int:
     """Calculate Levenshtein distance"""
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(a, b)
     if a == b:
         return 0
     if not a:
@@ -36,47 +73,49 @@ def edit_dist(a: str, b: str) -> int:
 
 def similarity(a: str, b: str) -> float:
     """Calculate similarity score (0.0 to 1.0)"""
-    a, b = normalize(a), normalize(b)
+    return _normalized_similarity(normalize(a), normalize(b))
+
+@functools.lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _normalized_similarity(a: str, b: str) -> float:
+    """Similarity of two already-normalized words"""
     if not a or not b:
         return 0.0
     dist = edit_dist(a, b)
     return 1.0 - dist / max(len(a), len(b))
 
+def _best_menu_word_similarity(text_words: List[str]) -> List[float]:
+    """For each word in MENU_WORDS, its best similarity to any of text_words (non-empty, normalized)"""
+    if _cdist is not None:
+        # One C-level (text words x menu words) similarity matrix, then a column max
+        matrix = _cdist(text_words, MENU_WORDS, scorer=_Levenshtein.normalized_similarity, dtype=np.float64)
+        return matrix.max(axis=0).tolist()
+    return [max(_normalized_similarity(tw, mw) for tw in text_words) for mw in MENU_WORDS]
+
 def find_all_dish_matches(text: str, min_word_sim: float = 0.85, min_coverage: float = 0.5):
     """Find menu items matching text"""
     text = text.lower()
-    text_words = [normalize(w) for w in text.split()]
+    text_words = [w for w in (normalize(w) for w in text.split()) if w]
     matches = []
+    if not text_words or not MENU_WORDS:
+        return matches
+    best = _best_menu_word_similarity(text_words)
     
-    for cat, item in all_menu_items():
-        name_words = [normalize(w) for w in item["name"].split()]
-        if not name_words:
+    for (cat, item, name_words, n_name_words), positions in zip(MENU_INDEX, _MENU_ITEM_WORD_POS):
+        if not positions:
             continue
 
-        matched_name_words = set()
-        max_sim = 0.0
-
-        for dw in name_words:
-            if not dw:
-                continue
-            for tw in text_words:
-                if not tw:
-                    continue
-                sim = similarity(tw, dw)
-                if sim > max_sim:
-                    max_sim = sim
-                if sim >= min_word_sim:
-                    matched_name_words.add(dw)
-
-        if not matched_name_words:
+        sims = [best[p] for p in positions]
+        matched_count = sum(1 for sim in sims if sim >= min_word_sim)
+        if not matched_count:
             continue
+        max_sim = max(sims)
 
-        coverage = len(matched_name_words) / len(name_words)
+        coverage = matched_count / len(name_words)
 
         if coverage < min_coverage:
             continue
         
-        if len(item["name"].split()) > 2 and coverage < 0.7:
+        if n_name_words > 2 and coverage < 0.7:
             continue
 
         score = coverage + 0.1 * max_sim
@@ -85,44 +124,50 @@ def find_all_dish_matches(text: str, min_word_sim: float = 0.85, min_coverage: f
     matches.sort(key=lambda x: x[2], reverse=True)
     return matches
 
+# ========== QUANTITY EXTRACTION ==========
+# Specific quantity patterns, tried in order (the first pattern that matches wins)
+_QTY_PATTERNS = [re.compile(p) for p in (
+    r'\b(\d+)\s+cold\s+coffee\b',  # "2 cold coffee"
+    r'\b(\d+)\s+garlic\s+naan\b',   # "3 garlic naan"
+    r'\b(\d+)\s+paneer\s+tikka\b',  # "2 paneer tikka"
+    r'\b(\d+)\s+butter\s+chicken\b', # "1 butter chicken"
+    r'\b(\d+)\s+spring\s+roll\b',   # "4 spring roll"
+    r'\b(\d+)\s+dal\s+makhani\b',   # "2 dal makhani"
+    r'\b(\d+)\s+masala\s+tea\b',    # "3 masala tea"
+    r'\b(\d+)\s+gulab\s+jamun\b',   # "2 gulab jamun"
+    r'\banother\s+(\d+)\b',         # "another 2"
+    r'\bmore\s+(\d+)\b',            # "more 3"
+)]
+_WORD_TO_NUM = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
+    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
+    'another': 1, 'additional': 1, 'extra': 1, 'more': 1,
+    'too': 2, 'to': 2  # Handle misheard "too" as "two"
+}
+# (word, "<word> <phrase>" pattern, number), in _WORD_TO_NUM order (first match wins)
+_QTY_WORD_PATTERNS = [
+    (word, re.compile(fr'\b{word}\s+([a-z\s]+)\b'), num) for word, num in _WORD_TO_NUM.items()
+]
+_DIGITS_RE = re.compile(r'\b\d+\b')
+_NON_WORD_RE = re.compile(r'[^\w]')
+
 def extract_quantity(text: str, default: int = 1) -> int:
     """Extract quantity from text - IMPROVED VERSION"""
-    word_to_num = {
-        'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-        'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-        'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-        'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
-        'another': 1, 'additional': 1, 'extra': 1, 'more': 1,
-        'too': 2, 'to': 2  # Handle misheard "too" as "two"
-    }
-    
     text_lower = text.lower()
     
     # First, check for specific quantity patterns
-    patterns = [
-        r'\b(\d+)\s+cold\s+coffee\b',  # "2 cold coffee"
-        r'\b(\d+)\s+garlic\s+naan\b',   # "3 garlic naan"
-        r'\b(\d+)\s+paneer\s+tikka\b',  # "2 paneer tikka"
-        r'\b(\d+)\s+butter\s+chicken\b', # "1 butter chicken"
-        r'\b(\d+)\s+spring\s+roll\b',   # "4 spring roll"
-        r'\b(\d+)\s+dal\s+makhani\b',   # "2 dal makhani"
-        r'\b(\d+)\s+masala\s+tea\b',    # "3 masala tea"
-        r'\b(\d+)\s+gulab\s+jamun\b',   # "2 gulab jamun"
-        r'\banother\s+(\d+)\b',         # "another 2"
-        r'\bmore\s+(\d+)\b',            # "more 3"
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _QTY_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return int(match.group(1))
     
     # Look for word numbers
-    for word, num in word_to_num.items():
+    for word, word_pattern, num in _QTY_WORD_PATTERNS:
         if word in text_lower:
             # Check if it's part of a phrase like "two cold coffee"
-            word_pattern = fr'\b{word}\s+([a-z\s]+)\b'
-            if re.search(word_pattern, text_lower):
+            if word_pattern.search(text_lower):
                 return num
     
     # Look for standalone numbers
@@ -131,7 +176,7 @@ def extract_quantity(text: str, default: int = 1) -> int:
     # Check for patterns like "cold coffee 2, 3"
     if any(item in text_lower for item in ["cold coffee", "garlic naan", "paneer tikka", "gulab jamun"]):
         # Extract all numbers after the item
-        numbers = re.findall(r'\b\d+\b', text_lower)
+        numbers = _DIGITS_RE.findall(text_lower)
         if numbers:
             # Take the last number mentioned (most likely the quantity)
             return int(numbers[-1])
@@ -139,7 +184,7 @@ def extract_quantity(text: str, default: int = 1) -> int:
     # Check for patterns like "coffee 2" or "naan 3"
     for i, token in enumerate(tokens):
         # Clean token of punctuation
-        clean_token = re.sub(r'[^\w]', '', token)
+        clean_token = _NON_WORD_RE.sub('', token)
         if clean_token.isdigit():
             # Check if previous token is a dish indicator
             if i > 0:
@@ -151,7 +196,7 @@ def extract_quantity(text: str, default: int = 1) -> int:
     
     # Check for quantity in the beginning
     first_token = tokens[0] if tokens else ""
-    clean_first = re.sub(r'[^\w]', '', first_token)
+    clean_first = _NON_WORD_RE.sub('', first_token)
     if clean_first.isdigit():
         return int(clean_first)
     
@@ -161,7 +206,7 @@ def extract_quantity(text: str, default: int = 1) -> int:
         for i, token in enumerate(tokens):
             if token in ['another', 'more', 'additional', 'extra'] and i + 1 < len(tokens):
                 next_token = tokens[i+1]
-                clean_next = re.sub(r'[^\w]', '', next_token)
+                clean_next = _NON_WORD_RE.sub('', next_token)
                 if clean_next.isdigit():
                     return int(clean_next)
         return 1  # Default to 1 for "another"
@@ -197,69 +242,78 @@ def menu_suggestion_string(show_items: bool = False, limit_per_category: Optiona
     else:
         return ", ".join(parts) if parts else "our menu categories."
 
+# ========== PHONETIC CORRECTIONS ==========
+# Common speech-to-text errors for Indian food terms, applied in this order
+# (later entries may rewrite the output of earlier ones)
+_RAW_PHONETIC_CORRECTIONS = {
+    "button hand": "butter naan",
+    "button nan": "butter naan",
+    "better nan": "butter naan",
+    "butter nan": "butter naan",
+    "plane nan": "plain naan",
+    "plain nan": "plain naan",
+    "garlic nan": "garlic naan",
+    "gulab jamun": "gulab jamun",
+    "golub jamun": "gulab jamun",
+    "gulab jaman": "gulab jamun",
+    "rasgulla": "rasgulla",
+    "ras gulla": "rasgulla",
+    "butter chicken": "butter chicken",
+    "better chicken": "butter chicken",
+    "panel tikka": "paneer tikka",
+    "paneer tika": "paneer tikka",
+    "biryani": "biryani",
+    "biriyani": "biryani",
+    "dal makhani": "dal makhani",
+    "dhal makhani": "dal makhani",
+    "prize": "price",
+    "prise": "price",
+    "cold coffee": "cold coffee",
+    "cool coffee": "cold coffee",
+    "cole coffee": "cold coffee",
+    "cold coffe": "cold coffee",
+    "pull coffee": "cold coffee",
+    "cold coffees": "cold coffee",
+    "too cold": "two cold",
+    "to cold": "two cold",
+    "2-pull": "two cold",
+    "wage option": "veg option",
+    "wage options": "veg options",
+    "wage option": "vegetarian option",
+    "wage dish": "veg dish",
+    "wage food": "veg food",
+    "wage items": "veg items",
+    "what's age": "what's veg",
+    "do you have wage": "do you have veg",
+    "any wage": "any veg",
+    "vegetable option": "vegetarian option",
+    "vegetable options": "vegetarian options",
+    "vegetarian option": "vegetarian option",
+    "vegetarian items": "vegetarian items",
+    "main curse": "main course",
+    "be average": "beverage",
+    "be averages": "beverages",
+    "what's in": "what's in",
+    "what is in": "what's in",
+    "what sin": "what's in",
+    "what's the": "what's in the",
+    "whats in": "what's in",
+    "whats the": "what's in the",
+    "whats in the": "what's in the"
+}
+# Identity entries are no-ops; each pattern is compiled once
+_PHONETIC_PATTERNS = [
+    (wrong, re.compile(r'\b' + re.escape(wrong) + r'\b', re.IGNORECASE), correct)
+    for wrong, correct in _RAW_PHONETIC_CORRECTIONS.items()
+    if wrong != correct
+]
+
 def apply_phonetic_corrections(text: str) -> str:
     """Fix common speech-to-text errors for Indian food terms"""
-    corrections = {
-        "button hand": "butter naan",
-        "button nan": "butter naan",
-        "better nan": "butter naan",
-        "butter nan": "butter naan",
-        "plane nan": "plain naan",
-        "plain nan": "plain naan",
-        "garlic nan": "garlic naan",
-        "gulab jamun": "gulab jamun",
-        "golub jamun": "gulab jamun",
-        "gulab jaman": "gulab jamun",
-        "rasgulla": "rasgulla",
-        "ras gulla": "rasgulla",
-        "butter chicken": "butter chicken",
-        "better chicken": "butter chicken",
-        "panel tikka": "paneer tikka",
-        "paneer tika": "paneer tikka",
-        "biryani": "biryani",
-        "biriyani": "biryani",
-        "dal makhani": "dal makhani",
-        "dhal makhani": "dal makhani",
-        "prize": "price",
-        "prise": "price",
-        "cold coffee": "cold coffee",
-        "cool coffee": "cold coffee",
-        "cole coffee": "cold coffee",
-        "cold coffe": "cold coffee",
-        "pull coffee": "cold coffee",
-        "cold coffees": "cold coffee",
-        "too cold": "two cold",
-        "to cold": "two cold",
-        "2-pull": "two cold",
-        "wage option": "veg option",
-        "wage options": "veg options",
-        "wage option": "vegetarian option",
-        "wage dish": "veg dish",
-        "wage food": "veg food",
-        "wage items": "veg items",
-        "what's age": "what's veg",
-        "do you have wage": "do you have veg",
-        "any wage": "any veg",
-        "vegetable option": "vegetarian option",
-        "vegetable options": "vegetarian options",
-        "vegetarian option": "vegetarian option",
-        "vegetarian items": "vegetarian items",
-        "main curse": "main course",
-        "be average": "beverage",
-        "be averages": "beverages",
-        "what's in": "what's in",
-        "what is in": "what's in",
-        "what sin": "what's in",
-        "what's the": "what's in the",
-        "whats in": "what's in",
-        "whats the": "what's in the",
-        "whats in the": "what's in the"
-    }
-    
     text_lower = text.lower()
-    for wrong, correct in corrections.items():
-        pattern = r'\b' + re.escape(wrong) + r'\b'
-        text_lower = re.sub(pattern, correct, text_lower, flags=re.IGNORECASE)
+    for wrong, pattern, correct in _PHONETIC_PATTERNS:
+        if wrong in text_lower:  # Cheap substring pre-check before running the regex
+            text_lower = pattern.sub(correct, text_lower)
     
     return text_lower
 
@@ -48,7 +48,7 @@ def main():
     json_repo = JSONRepository()
     
     # Initialize services
-    vad_service = VADService()
+    vad_service = VADService.prefetch()  # Loads in the background while other models load
     audio_processor = AudioProcessor(vad_service)
     entity_service = EntityService(json_repo)
     action_service = ActionService()
@@ -13,9 +13,9 @@ import logging
 import sounddevice as sd
 import soundfile as sf
 from utility.voice_reference_utils import process_audio_file_for_voice_reference
-from websocket.stt.stt_websocket import STTPersistentClient
-from websocket.ttt.llm_websocket import RestaurantLLM
-from websocket.tts.tts_websocket import XTTSPersistentClient
+from websocket_clients.stt.stt_websocket import STTPersistentClient
+from websocket_clients.ttt.llm_websocket import RestaurantLLM
+from websocket_clients.tts.tts_websocket import XTTSPersistentClient
 from core.order_manager import EnhancedOrderManager
 from core.restaurant_rag import RestaurantRAGSystem
 from core.restaurant_data import REST_DATA  # ✅ REQUIRED
@@ -423,4 +423,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:  # Optional (not available on Windows); default asyncio loop otherwise
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
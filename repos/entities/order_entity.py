@@ -8,6 +8,8 @@ class OrderManager:
     def __init__(self):
         self.lines: List[Dict] = []
         self.customer: Dict = {}
+        # describe_order() text; reset by every mutation of self.lines
+        self._desc_cache: Optional[str] = None
     
     def _find_line(self, name: str, variant: Optional[str] = None, addons: Optional[List[str]] = None) -> Optional[Dict]:
         """Find order line by item name, variant, and addons"""
@@ -43,6 +45,7 @@ class OrderManager:
         """
         if qty <= 0:
             return
+        self._desc_cache = None
         
         # Calculate total price including variant and addons
         total_price = float(unit_price)
@@ -75,6 +78,7 @@ class OrderManager:
         line = self._find_line(item_name)
         if not line:
             return
+        self._desc_cache = None
         if qty is None or qty >= line["qty"]:
             self.lines = [l for l in self.lines if l is not line]
         else:
@@ -89,6 +93,7 @@ class OrderManager:
         line = self._find_line(item_name)
         if line:
             line["qty"] = new_qty
+            self._desc_cache = None
             return True
         return False
     
@@ -101,6 +106,7 @@ class OrderManager:
         """Clear entire order"""
         self.lines = []
         self.customer = {}
+        self._desc_cache = None
     
     def is_empty(self) -> bool:
         """Check if order is empty"""
@@ -119,7 +125,9 @@ class OrderManager:
         }
     
     def describe_order(self) -> str:
-        """Generate order description with variants and addons"""
+        """Generate order description with variants and addons (cached until the order changes)"""
+        if self._desc_cache is not None:
+            return self._desc_cache
         if self.is_empty():
             return "You don't have any items in your order yet."
         
@@ -140,7 +148,8 @@ class OrderManager:
         
         total = self.subtotal()
         items_str = "; ".join(parts)
-        return f"Your current order: {items_str}. Total: {total:.0f} rupees."
+        self._desc_cache = f"Your current order: {items_str}. Total: {total:.0f} rupees."
+        return self._desc_cache
     
     def get_allergens_summary(self) -> List[str]:
         """Get all unique allergens from the order"""
@@ -27,10 +27,12 @@ class JSONRepository:
         else:
             self.data_file = data_file
         self.data: Dict[str, Any] = {}
+        self._version = 0
         self.load_data()
     
     def load_data(self) -> bool:
         """Load data from JSON file"""
+        self._version += 1  # Invalidate anything derived from the previous data
         try:
             with open(self.data_file, "r", encoding="utf-8") as f:
                 self.data = json.load(f)
@@ -41,6 +43,10 @@ class JSONRepository:
             self.data = {}
             return False
     
+    def version(self) -> int:
+        """Data version, incremented on every load"""
+        return self._version
+    
     def get_data(self) -> Dict[str, Any]:
         """Get all data"""
         return self.data
@@ -10,10 +10,13 @@ This service:
 - Saves order data to persistence layer
 - Returns action results and confirmation messages
 """
+import os
 import time
 import re
 import json
+import atexit
 import logging
+import threading
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -21,6 +24,67 @@ from repos.entities.order_entity import OrderManager
 
 logger = logging.getLogger(__name__)
 
+# Precompiled matchers for finalize_order (one scan each instead of per-keyword passes)
+# (confirmation keywords match anywhere, like the substring check they replace:
+# "confirmed", "proceeding", "finalized" all count)
+_CONFIRM_RE = re.compile(r"confirm|place order|proceed|checkout|finalize|yes that's all", re.IGNORECASE)
+# ("my name is" outranks "i am"/"i'm", which also opens phrases like "I'm sure")
+_FINALIZE_RE = re.compile(
+    r"\bmy name is\s+(?P<name>[A-Za-z]+)|\b(?:i\s*am|i'?m)\s+(?P<alt_name>[A-Za-z]+)|\b(?P<phone>\d{10})\b",
+    re.IGNORECASE,
+)
+
+# Order journal: project root/orders/orders_history.json (this file is in services/business/)
+_ORDERS_PATH = Path(__file__).parent.parent.parent / "orders" / "orders_history.json"
+_ORDERS_BUFFER_SIZE = 64 * 1024
+_ORDERS_FSYNC_INTERVAL = 2.0  # seconds; upper bound on unsynced order data
+
+_orders_lock = threading.Lock()
+_orders_fh = None
+_orders_timer = None
+
+
+def _append_order(order_data: dict) -> None:
+    """Append one order to the JSONL journal; fsync is batched by a timer"""
+    global _orders_fh, _orders_timer
+    line = json.dumps(order_data, separators=(",", ":")) + "\n"
+    with _orders_lock:
+        if _orders_fh is None:
+            _ORDERS_PATH.parent.mkdir(exist_ok=True)
+            _orders_fh = open(_ORDERS_PATH, "a", buffering=_ORDERS_BUFFER_SIZE)
+        _orders_fh.write(line)
+        if _orders_timer is None:
+            _orders_timer = threading.Timer(_ORDERS_FSYNC_INTERVAL, _sync_orders)
+            _orders_timer.daemon = True
+            _orders_timer.start()
+
+
+def _sync_orders() -> None:
+    """Flush buffered orders and fsync the journal"""
+    global _orders_timer
+    with _orders_lock:
+        _orders_timer = None
+        if _orders_fh is None:
+            return
+        try:
+            _orders_fh.flush()
+            os.fsync(_orders_fh.fileno())
+        except Exception as e:
+            logger.error(f"Could not sync orders: {e}")
+
+
+@atexit.register
+def _close_orders() -> None:
+    """Make sure every buffered order reaches disk on shutdown"""
+    global _orders_fh
+    if _orders_timer is not None:
+        _orders_timer.cancel()
+    _sync_orders()
+    with _orders_lock:
+        if _orders_fh is not None:
+            _orders_fh.close()
+            _orders_fh = None
+
 
 class ActionService:
     """
@@ -33,28 +97,28 @@ class ActionService:
     @staticmethod
     def finalize_order(order: OrderManager, text: str) -> Tuple[bool, Optional[str]]:
         """Finalize order with customer details"""
-        text_low = text.lower()
-        
         # Check for confirmation keywords
-        confirm_keywords = ["confirm", "place order", "yes that's all", "proceed", "checkout", "finalize"]
-        if not any(kw in text_low for kw in confirm_keywords):
+        if not _CONFIRM_RE.search(text):
             return False, None
         
         if order.is_empty():
             return True, "Your order is empty. Please add items first."
         
-        # Extract name
+        # Extract name and phone in a single pass; an "i am" name is only
+        # used when the text has no "my name is"
         name = None
-        if "my name is" in text_low:
-            name = text_low.split("my name is")[1].split()[0].strip().title()
-        elif "i am" in text_low or "i'm" in text_low:
-            parts = text_low.replace("i'm", "i am").split("i am")
-            if len(parts) > 1:
-                name = parts[1].strip().split()[0].title()
-        
-        # Extract phone
-        phone_match = re.search(r'\b\d{10}\b', text)
-        phone = phone_match.group(0) if phone_match else None
+        alt_name = None
+        phone = None
+        for m in _FINALIZE_RE.finditer(text):
+            if m.group('name'):
+                if name is None:
+                    name = m.group('name').title()
+            elif m.group('alt_name'):
+                if alt_name is None:
+                    alt_name = m.group('alt_name').title()
+            elif phone is None:
+                phone = m.group('phone')
+        name = name or alt_name
         
         if name and phone:
             order_id = f"ORD{int(time.time())}"
@@ -69,13 +133,7 @@ class ActionService:
             
             # Save to file
             try:
-                # Save to project root/orders directory
-                # This file is in services/business/, so project root is 2 levels up
-                project_root = Path(__file__).parent.parent.parent  # project root
-                orders_dir = project_root / "orders"
-                orders_dir.mkdir(exist_ok=True)
-                with open(orders_dir / "orders_history.json", "a") as f:
-                    f.write(json.dumps(order_data) + "\n")
+                _append_order(order_data)
                 logger.info(f"Order saved: {order_id}")
             except Exception as e:
                 logger.error(f"Could not save order: {e}")
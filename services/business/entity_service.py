@@ -11,7 +11,9 @@ This service depends on IMenuRepository interface, not concrete implementation.
 Changes to JSONRepository implementation won't affect this service.
 """
 import re
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Union
+
+from services.infrastructure.normalized_text import NormalizedText
 
 # Use interface for stable contract
 try:
@@ -20,6 +22,84 @@ except ImportError:
     # Fallback for backward compatibility
     from repos.json_repo import JSONRepository as IMenuRepository
 
+# Quantity tokens (number words and digit runs), matched in a single scan
+_WORD_TO_NUM = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+}
+_QTY_RE = re.compile(r'\b(?:one|two|three|four|five|six|seven|eight|nine|ten)\b|\d+')
+
+# Separators for multiple items, in precedence order: only the first one present
+# splits, so "X with addon and Y" keeps the addon attached to X
+_MULTI_SEPARATORS = (' and ', ',', ' with ', ' plus ', ' along with ', ' also ')
+# Fallback split on quantity words when no separator is present
+_QTY_SPLIT_RE = re.compile(
+    r'\b(one|two|three|four|five|six|seven|eight|nine|ten|\d+)\s+([^,]+?)'
+    r'(?=\s+(?:one|two|three|four|five|six|seven|eight|nine|ten|\d+)\s+|\s*$)'
+)
+
+# Translate table deleting every non-letter in the Latin-1 range (ASCII fast path for normalize)
+_NON_ALPHA_DELETE = str.maketrans('', '', ''.join(chr(b) for b in range(256) if not chr(b).isalpha()))
+
+# Max memoized find_all_dish_matches results per EntityService
+MATCH_CACHE_SIZE = 256
+
+# Speech-to-text corrections for Indian food terms
+_RAW_PHONETIC_CORRECTIONS = {
+    "how to make": "how to make",
+    "how do you make": "how do you make",
+    # Bread items
+    "button hand": "butter naan",
+    "button nan": "butter naan",
+    "better nan": "butter naan",
+    "butter nan": "butter naan",
+    "plane nan": "plain naan",
+    "plain nan": "plain naan",
+    "garlic nan": "garlic naan",
+    "roti": "roti",
+    "paratha": "paratha",
+    
+    # Desserts
+    "gulab jamun": "gulab jamun",
+    "golub jamun": "gulab jamun",
+    "gulab jaman": "gulab jamun",
+    "rasgulla": "rasgulla",
+    "ras gulla": "rasgulla",
+    
+    # Main dishes
+    "butter chicken": "butter chicken",
+    "better chicken": "butter chicken",
+    "panel tikka": "paneer tikka",
+    "paneer tika": "paneer tikka",
+    "biryani": "biryani",
+    "biriyani": "biryani",
+    "dal makhani": "dal makhani",
+    "dhal makhani": "dal makhani",
+    "masala chai": "masala chai",
+    "masala tea": "masala chai",
+    "fresh lime": "fresh lime soda",
+    
+    # Quantity phrases (Indian English)
+    "on 21": "21",  # "On 21 Gulab Jamun" → "21 Gulab Jamun"
+    "i want 21": "i want 21",
+    "give me 21": "give me 21",
+    
+    # Common words
+    "prize": "price",
+    "prise": "price",
+    "cost": "price",
+    "rupee": "rupees",
+    "ruppes": "rupees",
+}
+
+# Identity entries never change the text, so drop them; sort longest-first so
+# multi-word phrases ("butter nan") are corrected before any shorter key.
+_PHONETIC_CORRECTIONS = {k: v for k, v in _RAW_PHONETIC_CORRECTIONS.items() if k != v}
+_PHONETIC_PATTERNS = [
+    (wrong, re.compile(r'\b' + re.escape(wrong) + r'\b'), _PHONETIC_CORRECTIONS[wrong])
+    for wrong in sorted(_PHONETIC_CORRECTIONS, key=len, reverse=True)
+]
+
 
 class EntityService:
     """
@@ -36,10 +116,30 @@ class EntityService:
             menu_repo: Menu repository implementing IMenuRepository protocol
         """
         self.menu_repo = menu_repo
+        # Normalized dish-name words per menu item, rebuilt when the menu object changes
+        self._indexed_menu = None
+        self._menu_index: List[Tuple[Dict, Dict, List[str], int]] = []
+        # Recent find_all_dish_matches results (dialog branches re-query the same text)
+        self._match_cache: Dict[Tuple[str, float, float], List[Tuple[Dict, Dict, float]]] = {}
+    
+    def _get_menu_index(self) -> List[Tuple[Dict, Dict, List[str], int]]:
+        """(category, item, normalized name words, raw word count) for every menu item"""
+        menu = self.menu_repo.get_menu()
+        if menu is not self._indexed_menu:
+            index = []
+            for cat, item in self.menu_repo.all_menu_items():
+                raw_words = item["name"].split()
+                index.append((cat, item, [self.normalize(w) for w in raw_words], len(raw_words)))
+            self._menu_index = index
+            self._indexed_menu = menu
+            self._match_cache.clear()
+        return self._menu_index
     
     @staticmethod
     def normalize(word: str) -> str:
         """Normalize word for matching"""
+        if word.isascii():
+            return word.lower().translate(_NON_ALPHA_DELETE)
         return "".join(x for x in word.lower() if x.isalpha())
     
     @staticmethod
@@ -83,13 +183,19 @@ class EntityService:
         """
         Find menu items matching text, scored by how many name-words match.
         Returns list of (category, item, score) tuples.
+        
+        Results are memoized per (text, thresholds) until the menu changes.
         """
-        text_low = text.lower()
+        menu_index = self._get_menu_index()
+        key = (text, min_word_sim, min_coverage)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
         text_words = [self.normalize(w) for w in text.split()]
         matches = []
         
-        for cat, item in self.menu_repo.all_menu_items():
-            name_words = [self.normalize(w) for w in item["name"].split()]
+        for cat, item, name_words, raw_word_count in menu_index:
             if not name_words:
                 continue
 
@@ -120,7 +226,7 @@ class EntityService:
                 continue
             
             # Penalize matches that are too short
-            if len(item["name"].split()) > 2 and coverage < 0.7:
+            if raw_word_count > 2 and coverage < 0.7:
                 continue
 
             # Final score: prioritize coverage, use max_sim as small tie-breaker
@@ -128,7 +234,11 @@ class EntityService:
             matches.append((cat, item, score))
         
         matches.sort(key=lambda x: x[2], reverse=True)
-        return matches
+        
+        if len(self._match_cache) >= MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[key] = matches
+        return list(matches)
     
     def best_dish_match(self, text: str) -> Tuple[Optional[Dict], Optional[Dict], float]:
         """
@@ -147,122 +257,57 @@ class EntityService:
     @staticmethod
     def extract_quantity(text: str, default: int = 1) -> int:
         """Extract quantity from text"""
-        word_to_num = {
-            'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-            'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
-        }
-
-        tokens = text.lower().split()
-
-        # Check for word numbers
-        for token in tokens:
-            if token in word_to_num:
-                return word_to_num[token]
+        # Drop digit-group commas first so "1,000" scans as one number
+        found = _QTY_RE.findall(text.lower().replace(',', ''))
+        if not found:
+            return default
+        
+        # Word numbers take precedence over digits
+        for token in found:
+            if token in _WORD_TO_NUM:
+                return _WORD_TO_NUM[token]
         
-        nums = []
-        for t in tokens:
-            t_clean = "".join(ch for ch in t if ch.isdigit())
-            if t_clean.isdigit():
-                nums.append(int(t_clean))
-        return max(nums) if nums else default
+        return max(int(token) for token in found)
     
     @staticmethod
     def detect_multiple_dishes(text: str) -> List[str]:
         """
         Detect if user mentioned multiple dishes using common separators.
         Returns list of dish phrases.
+        
+        Example:
+            "paneer tikka with extra cheese and two garlic naan"
+            -> ['paneer tikka with extra cheese', 'two garlic naan']
         """
         text_low = text.lower()
         
-        # Common separators for multiple items
-        separators = [
-            ' and ', 
-            ',', 
-            ' with ', 
-            ' plus ', 
-            ' along with ',
-            ' also '
-        ]
-        
-        # Try to split by separators
+        # Split on the first separator present (earlier ones take precedence)
         dishes = []
-        for sep in separators:
+        for sep in _MULTI_SEPARATORS:
             if sep in text_low:
-                parts = text_low.split(sep)
-                dishes = [p.strip() for p in parts if p.strip()]
+                dishes = [p for p in map(str.strip, text_low.split(sep)) if p]
                 break
         
         # If no separator found but has multiple quantity words
         if not dishes and ('one' in text_low or 'two' in text_low or 'three' in text_low):
-            # Try to split by quantity words
-            quantity_pattern = r'\b(one|two|three|four|five|six|seven|eight|nine|ten|\d+)\s+([^,]+?)(?=\s+(?:one|two|three|four|five|six|seven|eight|nine|ten|\d+)\s+|\s*$)'
-            matches = re.findall(quantity_pattern, text_low)
+            matches = _QTY_SPLIT_RE.findall(text_low)
             if matches:
                 dishes = [match[1].strip() for match in matches]
         
         return dishes if dishes else [text_low]
     
     @staticmethod
-    def apply_phonetic_corrections(text: str) -> str:
+    def apply_phonetic_corrections(text: Union[str, NormalizedText]) -> str:
         """
         Fix common speech-to-text errors for Indian food terms.
         Apply this BEFORE processing the text.
         """
-        corrections = {
-            "how to make": "how to make",
-            "how do you make": "how do you make",
-            # Bread items
-            "button hand": "butter naan",
-            "button nan": "butter naan",
-            "better nan": "butter naan",
-            "butter nan": "butter naan",
-            "plane nan": "plain naan",
-            "plain nan": "plain naan",
-            "garlic nan": "garlic naan",
-            "roti": "roti",
-            "paratha": "paratha",
-            
-            # Desserts
-            "gulab jamun": "gulab jamun",
-            "golub jamun": "gulab jamun",
-            "gulab jaman": "gulab jamun",
-            "rasgulla": "rasgulla",
-            "ras gulla": "rasgulla",
-            
-            # Main dishes
-            "butter chicken": "butter chicken",
-            "better chicken": "butter chicken",
-            "panel tikka": "paneer tikka",
-            "paneer tika": "paneer tikka",
-            "biryani": "biryani",
-            "biriyani": "biryani",
-            "dal makhani": "dal makhani",
-            "dhal makhani": "dal makhani",
-            "masala chai": "masala chai",
-            "masala tea": "masala chai",
-            "fresh lime": "fresh lime soda",
-            
-            # Quantity phrases (Indian English)
-            "on 21": "21",  # "On 21 Gulab Jamun" → "21 Gulab Jamun"
-            "i want 21": "i want 21",
-            "give me 21": "give me 21",
-            
-            # Common words
-            "prize": "price",
-            "prise": "price",
-            "cost": "price",
-            "rupee": "rupees",
-            "ruppes": "rupees",
-        }
-        
-        text_lower = text.lower()
+        text_lower = text.lower if isinstance(text, NormalizedText) else text.lower()
         
-        # Apply corrections
-        for wrong, correct in corrections.items():
+        # Apply corrections (longest phrases first)
+        for wrong, pattern, correct in _PHONETIC_PATTERNS:
             if wrong in text_lower:
-                # Use word boundaries to avoid partial replacements
-                pattern = r'\b' + re.escape(wrong) + r'\b'
-                text_lower = re.sub(pattern, correct, text_lower, flags=re.IGNORECASE)
+                text_lower = pattern.sub(correct, text_lower)
         
         return text_lower
 
@@ -10,7 +10,9 @@ Enforces business rules and policies:
 This service centralizes all business policy decisions.
 """
 import datetime
-from typing import Tuple
+import re
+import time
+from typing import Tuple, Union
 
 from global_data import (
     RESTAURANT_OPEN_HOUR,
@@ -18,6 +20,18 @@ from global_data import (
     OUT_OF_STOCK_ITEMS,
     FOOD_KEYWORDS
 )
+from services.infrastructure.normalized_text import NormalizedText
+
+# Preformatted hours responses and per-minute memo for is_restaurant_open
+_OPEN_RESULT = (True, "")
+_CLOSED_RESULT = (
+    False,
+    f"Sorry, we're currently closed. Our hours are {RESTAURANT_OPEN_HOUR} AM to {RESTAURANT_CLOSE_HOUR} PM."
+)
+_open_cache = (-1, _OPEN_RESULT)
+
+# FOOD_KEYWORDS flattened into one alternation so should_block_llm is a single C-level scan
+_FOOD_KEYWORDS_RE = re.compile("|".join(re.escape(kw) for kw in FOOD_KEYWORDS))
 
 
 class PolicyService:
@@ -38,13 +52,21 @@ class PolicyService:
         Returns:
             Tuple of (is_open, message)
         """
-        now = datetime.datetime.now()
-        current_hour = now.hour
+        global _open_cache
         
+        # Opening state can only change on a minute boundary, so reuse the last answer
+        minute_key = int(time.time() // 60)
+        if minute_key == _open_cache[0]:
+            return _open_cache[1]
+        
+        current_hour = datetime.datetime.now().hour
         if RESTAURANT_OPEN_HOUR <= current_hour < RESTAURANT_CLOSE_HOUR:
-            return True, ""
+            result = _OPEN_RESULT
         else:
-            return False, f"Sorry, we're currently closed. Our hours are {RESTAURANT_OPEN_HOUR} AM to {RESTAURANT_CLOSE_HOUR} PM."
+            result = _CLOSED_RESULT
+        
+        _open_cache = (minute_key, result)
+        return result
     
     @staticmethod
     def check_item_availability(item_name: str) -> Tuple[bool, str]:
@@ -65,18 +87,18 @@ class PolicyService:
         return True, ""
     
     @staticmethod
-    def should_block_llm(text: str) -> bool:
+    def should_block_llm(text: Union[str, NormalizedText]) -> bool:
         """
         Return True if query should be blocked from LLM and handled by JSON only.
         
         Uses FOOD_KEYWORDS from global_data to determine if query is food-related.
         
         Args:
-            text: User input text to check
+            text: User input text (raw or pre-normalized) to check
             
         Returns:
             True if query should be blocked from LLM
         """
-        text_low = text.lower()
-        return any(keyword in text_low for keyword in FOOD_KEYWORDS)
+        text_low = text.lower if isinstance(text, NormalizedText) else text.lower()
+        return _FOOD_KEYWORDS_RE.search(text_low) is not None
 
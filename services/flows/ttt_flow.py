@@ -3,6 +3,8 @@ TTT Flow - orchestrates text-to-text (LLM) processing
 
 Uses interfaces to reduce coupling between flows and services.
 """
+from services.infrastructure.normalized_text import NormalizedText
+
 # Use interfaces for stable contracts
 try:
     from core.interfaces import ITTTService, IDialogService, IPolicyService, IOrderManager
@@ -45,14 +47,17 @@ class TTTFlow:
         
         brain_start = time.time()
         
+        # Lowercase/tokenize once and share across services
+        norm = NormalizedText.from_raw(text)
+        
         # Try dialog service first (JSON-based responses)
-        reply = self.dialog_service.process_message(text, order)
+        reply = self.dialog_service.process_message(norm, order)
         json_used = reply is not None
         llm_time = 0.0
         
         if not reply:
             # CHECK if query should go to LLM
-            if self.policy_service.should_block_llm(text):
+            if self.policy_service.should_block_llm(norm):
                 # Default response for food queries that JSON couldn't handle
                 reply = "Let me check our menu for you. Could you please repeat the dish name clearly?"
             else:
@@ -7,6 +7,7 @@ Foundational runtime support services:
 - Metrics collection
 - Audio processing (I/O operations, recording)
 - Voice activity detection (speech detection)
+- Normalized text (shared lowercase/token views of an utterance)
 """
 
 from .config_service import ConfigService
@@ -14,6 +15,7 @@ from .logger_service import setup_logging, log_conversation
 from .metrics_service import MetricsService
 from .audio_processor import AudioProcessor
 from .vad_service import VADService
+from .normalized_text import NormalizedText
 
 __all__ = [
     'ConfigService',
@@ -22,5 +24,6 @@ __all__ = [
     'MetricsService',
     'AudioProcessor',
     'VADService',
+    'NormalizedText',
 ]
 
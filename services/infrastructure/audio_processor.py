@@ -19,6 +19,9 @@ from typing import Tuple
 from .config_service import INPUT_DEVICE, OUTPUT_DEVICE, SAMPLE_RATE, MAX_SILENCE, VAD_THRESHOLD
 from .vad_service import VADService
 
+# Initial capacity of the recording buffer; it doubles if an utterance runs longer
+INITIAL_RECORD_SEC = 15
+
 # Note: Audio decode/resample/normalize/encode operations would be added here
 # as methods when needed for format conversion and audio processing
 
@@ -60,7 +63,10 @@ class AudioProcessor:
         """
         print("[Audio] 🎤 Listening...")
         
-        audio_chunks = []
+        # Preallocated recording buffer, filled in place (grown by doubling if needed)
+        audio_buf = np.empty(int(INITIAL_RECORD_SEC * SAMPLE_RATE), dtype=np.float32)
+        pos = 0
+        frame_count = 0
         silence_start = None
         
         # Use larger buffer (1024 samples) for better performance
@@ -82,11 +88,18 @@ class AudioProcessor:
                 if frame.size == 0:
                     continue
                 
-                audio_chunks.append(frame)
+                n = frame.size
+                if pos + n > audio_buf.size:
+                    grown = np.empty(max(audio_buf.size * 2, pos + n), dtype=np.float32)
+                    grown[:pos] = audio_buf[:pos]
+                    audio_buf = grown
+                audio_buf[pos:pos + n] = frame
+                pos += n
+                frame_count += 1
                 
                 # Check for silence using VAD (only on recent frames for speed)
                 # For long recordings, check every 2nd frame to reduce VAD overhead
-                if len(audio_chunks) % 2 == 0 or len(audio_chunks) < 10:
+                if frame_count % 2 == 0 or frame_count < 10:
                     speech_prob = self.vad_service.detect_speech(frame, threshold)
                     
                     if speech_prob < threshold:
@@ -104,8 +117,5 @@ class AudioProcessor:
             stream.stop()
             stream.close()
         
-        if not audio_chunks:
-            return np.array([], dtype=np.float32)
-        
-        return np.concatenate(audio_chunks)
+        return audio_buf[:pos]
 
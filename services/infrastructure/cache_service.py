@@ -5,13 +5,116 @@ Handles HuggingFace model cache operations with proper Windows permission handli
 Decouples cache management from model loading logic.
 """
 import os
-import shutil
+import re
+import logging
 import time
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union
 from platform import system
 
+logger = logging.getLogger(__name__)
+
+
+# chmod/stat are I/O-bound syscalls that release the GIL, so large trees
+# are fanned out to a thread pool; small ones skip the pool setup cost.
+_PARALLEL_THRESHOLD = 256
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# fwalk (dir_fd-relative unlink/rmdir) is POSIX-only
+_HAS_FWALK = hasattr(os, "fwalk") and {os.unlink, os.rmdir, os.chmod} <= os.supports_dir_fd
+
+
+def _iter_entries(path, include_dirs: bool = False):
+    """
+    Recursively yield DirEntry objects under path using os.scandir.
+    
+    DirEntry caches the type (and on Windows the stat) returned by the
+    directory listing, so callers avoid an extra stat per entry.
+    
+    Args:
+        path: Directory to walk (str or Path)
+        include_dirs: Also yield directory entries (before their contents)
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if include_dirs:
+                    yield entry
+                yield from _iter_entries(entry.path, include_dirs)
+            else:
+                yield entry
+
+
+def _chmod_entry(entry: os.DirEntry) -> None:
+    """Make a file (or directory) writable so it can be deleted"""
+    if entry.is_dir(follow_symlinks=False):
+        os.chmod(entry.path, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
+    else:
+        os.chmod(entry.path, stat.S_IWRITE | stat.S_IREAD)
+
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """Size of a file entry, 0 if it disappeared while scanning"""
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _unlink_writable(path: str, dir_fd: Optional[int] = None) -> None:
+    """Unlink a file, clearing a read-only flag (Windows) and retrying once"""
+    try:
+        os.unlink(path, dir_fd=dir_fd)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD, dir_fd=dir_fd)
+        os.unlink(path, dir_fd=dir_fd)
+
+
+def _rmdir_writable(path: str, dir_fd: Optional[int] = None) -> None:
+    """Remove an (empty) directory or a directory symlink, fixing permissions once"""
+    try:
+        os.rmdir(path, dir_fd=dir_fd)
+    except NotADirectoryError:
+        os.unlink(path, dir_fd=dir_fd)  # Symlink to a directory; never descended into
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC, dir_fd=dir_fd)
+        os.rmdir(path, dir_fd=dir_fd)
+
+
+def _rmtree_fast(path: Union[str, Path]) -> None:
+    """
+    Remove a directory tree with one bottom-up walk and no per-subdir recursion.
+    
+    Uses os.fwalk where available (unlink relative to an open dir fd, no path
+    joins) and os.walk(topdown=False) elsewhere (e.g. Windows). Permission
+    fixes are applied inline only where a delete fails, so the tree is not
+    walked once for chmod and again for removal.
+    """
+    path = os.fspath(path)
+    if _HAS_FWALK:
+        for _, dirs, files, root_fd in os.fwalk(path, topdown=False):
+            for f in files:
+                _unlink_writable(f, root_fd)
+            for d in dirs:
+                _rmdir_writable(d, root_fd)
+    else:
+        for root, dirs, files in os.walk(path, topdown=False, followlinks=False):
+            for f in files:
+                _unlink_writable(os.path.join(root, f))
+            for d in dirs:
+                _rmdir_writable(os.path.join(root, d))
+    _rmdir_writable(path)
+
+
+def _map_entries(func, entries: list):
+    """Apply func to every entry, in a thread pool for large lists"""
+    if len(entries) < _PARALLEL_THRESHOLD:
+        return [func(e) for e in entries]
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+        return list(ex.map(func, entries))
+
 
 class CacheService:
     """
@@ -33,6 +136,9 @@ class CacheService:
         self.hf_cache = self.cache_base / "huggingface" / "hub"
         self.ctranslate_cache = self.cache_base / "ctranslate2"
         self.is_windows = system() == "Windows"
+        self._path_cache: dict = {}  # model_id -> hf cache Path
+        # Permission fixing only matters on Windows; skip the call elsewhere
+        self._maybe_fix_perms = self._fix_permissions if self.is_windows else (lambda path: True)
     
     def _normalize_model_name(self, model_id: str) -> str:
         """
@@ -51,71 +157,77 @@ class CacheService:
         # Replace slashes with double dashes (HuggingFace convention)
         return model_id.replace('/', '--')
     
-    def _fix_permissions(self, path: Path) -> bool:
+    def _fix_permissions(self, path: Union[str, Path]) -> bool:
         """
         Fix file permissions on Windows to allow deletion.
         
         Args:
-            path: Path to file or directory
+            path: Path (str or Path) to file or directory
             
         Returns:
             True if permissions were fixed, False otherwise
         """
-        if not self.is_windows or not path.exists():
+        path = os.fspath(path)  # Plain str for every os.* call below
+        if not self.is_windows:
             return True
         
         try:
-            # On Windows, make files writable before deletion
-            if path.is_file():
+            # On Windows, make files writable before deletion (one stat for the type)
+            try:
+                mode = os.stat(path).st_mode
+            except FileNotFoundError:
+                return True
+            if stat.S_ISREG(mode):
                 os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
-            elif path.is_dir():
+            elif stat.S_ISDIR(mode):
                 # Recursively fix permissions for all files in directory
-                for root, dirs, files in os.walk(path):
-                    for d in dirs:
-                        os.chmod(Path(root) / d, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
-                    for f in files:
-                        os.chmod(Path(root) / f, stat.S_IWRITE | stat.S_IREAD)
+                _map_entries(_chmod_entry, list(_iter_entries(path, include_dirs=True)))
                 os.chmod(path, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
             return True
         except Exception as e:
-            print(f"[CACHE] ⚠️  Could not fix permissions for {path}: {e}")
+            logger.warning("Could not fix permissions for %s: %s", path, e)
             return False
     
-    def _safe_remove(self, path: Path, retries: int = 3, delay: float = 0.5) -> bool:
+    def _safe_remove(self, path: Union[str, Path], retries: int = 3, delay: float = 0.5) -> bool:
         """
         Safely remove a file or directory with retry logic and permission handling.
         
         Args:
-            path: Path to remove
+            path: Path (str or Path) to remove
             retries: Number of retry attempts
             delay: Delay between retries in seconds
             
         Returns:
             True if removal was successful, False otherwise
         """
-        if not path.exists():
+        path = os.fspath(path)  # Plain str for every os.* call below
+        try:
+            mode = os.lstat(path).st_mode  # One stat for existence and type
+        except FileNotFoundError:
             return True
         
-        # Fix permissions before attempting removal
-        self._fix_permissions(path)
+        # Directories fix permissions inline while being removed
+        is_dir = stat.S_ISDIR(mode)
+        if not is_dir:
+            self._maybe_fix_perms(path)
         
         for attempt in range(retries):
             try:
-                if path.is_file():
-                    path.unlink()
-                elif path.is_dir():
-                    shutil.rmtree(path)
+                if is_dir:
+                    _rmtree_fast(path)
+                else:
+                    os.unlink(path)
                 return True
             except PermissionError as e:
                 if attempt < retries - 1:
-                    print(f"[CACHE] ⚠️  Permission error (attempt {attempt + 1}/{retries}): {e}")
+                    logger.warning("Permission error (attempt %d/%d) on %s: %s", attempt + 1, retries, path, e)
                     time.sleep(delay * (attempt + 1))  # Exponential backoff
-                    self._fix_permissions(path)
+                    self._maybe_fix_perms(path)
                 else:
-                    print(f"[CACHE] ❌ Failed to remove {path} after {retries} attempts: {e}")
+                    logger.error("Failed to remove %s after %d attempts: %s", path, retries, e)
                     return False
             except Exception as e:
-                print(f"[CACHE] ⚠️  Error removing {path}: {e}")
+                logger.warning("Error removing %s (attempt %d/%d): %s", path, attempt + 1, retries, e)
                 if attempt < retries - 1:
                     time.sleep(delay)
                 else:
@@ -133,8 +245,10 @@ class CacheService:
         Returns:
             Path to model cache directory
         """
-        normalized_name = self._normalize_model_name(model_id)
-        return self.hf_cache / f"models--{normalized_name}"
+        path = self._path_cache.get(model_id)
+        if path is None:
+            path = self._path_cache[model_id] = self.hf_cache / f"models--{model_id.replace('/', '--')}"
+        return path
     
     def clear_model_cache(self, model_id: str) -> bool:
         """
@@ -148,7 +262,7 @@ class CacheService:
         """
         model_cache = self.get_model_cache_path(model_id)
         
-        if not model_cache.exists():
+        if not os.path.exists(model_cache):
             return True  # Nothing to clear
         
         print(f"[CACHE] 🧹 Clearing cache for model: {model_id}")
@@ -171,26 +285,32 @@ class CacheService:
         Returns:
             True if any corrupted snapshots were found and cleared
         """
-        model_cache = self.get_model_cache_path(model_id)
-        
-        if not model_cache.exists():
-            return False
-        
-        snapshots_dir = model_cache / "snapshots"
-        if not snapshots_dir.exists():
+        # A missing model cache also means a missing snapshots dir
+        snapshots_dir = os.path.join(self.get_model_cache_path(model_id), "snapshots")
+        if not os.path.isdir(snapshots_dir):
             return False
         
         cleared_any = False
-        for snapshot in snapshots_dir.iterdir():
-            if snapshot.is_dir():
-                # Check for common corruption indicators
-                model_bin = snapshot / "model.bin"
-                config_json = snapshot / "config.json"
+        with os.scandir(snapshots_dir) as it:
+            for snapshot in it:
+                if not snapshot.is_dir(follow_symlinks=False):
+                    continue
                 
-                # If snapshot exists but critical files are missing, it's corrupted
-                if not model_bin.exists() or not config_json.exists():
+                # If snapshot exists but critical files are missing, it's corrupted.
+                # One readdir rules out absent files; names that are present are
+                # still resolved, since snapshot files are symlinks into blobs/
+                # and a dangling link is as broken as a missing file.
+                snap_path = snapshot.path
+                try:
+                    names = set(os.listdir(snap_path))
+                except OSError:
+                    continue
+                if not all(
+                    name in names and os.path.exists(os.path.join(snap_path, name))
+                    for name in ("model.bin", "config.json")
+                ):
                     print(f"[CACHE] ⚠️  Found corrupted snapshot: {snapshot.name}")
-                    if self._safe_remove(snapshot):
+                    if self._safe_remove(snap_path):
                         print(f"[CACHE] ✅ Cleared corrupted snapshot")
                         cleared_any = True
         
@@ -215,46 +335,63 @@ class CacheService:
         if model_id:
             # Normalize model ID for search
             normalized = model_id.lower().replace('/', '-').replace('_', '-')
-            search_terms.append(normalized)
+            search_terms.append(re.escape(normalized))
+        search_re = re.compile("|".join(search_terms), re.IGNORECASE)
         
         try:
-            for item in list(self.ctranslate_cache.iterdir()):
-                item_name_lower = item.name.lower()
-                if any(term in item_name_lower for term in search_terms):
-                    if self._safe_remove(item):
-                        print(f"[CACHE] ✅ Cleared ctranslate2 cache: {item.name}")
-                        cleared_any = True
+            with os.scandir(self.ctranslate_cache) as it:
+                for item in it:
+                    if search_re.search(item.name):
+                        if self._safe_remove(item.path):
+                            print(f"[CACHE] ✅ Cleared ctranslate2 cache: {item.name}")
+                            cleared_any = True
         except Exception as e:
             print(f"[CACHE] ⚠️  Error clearing ctranslate2 cache: {e}")
         
         return cleared_any
     
-    def clear_all_model_caches(self, model_id: str) -> bool:
+    def clear_all_model_caches(self, model_id: str, deep_clean: bool = False) -> bool:
         """
         Clear all caches related to a model (HuggingFace + CTranslate2).
         
         Args:
             model_id: Model identifier
+            deep_clean: Always sweep hf_cache for remaining references, even
+                when the model cache itself was removed cleanly
             
         Returns:
             True if all caches were cleared successfully
         """
         print(f"[CACHE] 🧹 Clearing all caches for model: {model_id}")
+        normalized_name = self._normalize_model_name(model_id)
+        primary_name = f"models--{normalized_name}"
+        
+        # Clear HuggingFace cache (known path, no listing needed)
+        hf_success = True if deep_clean else self.clear_model_cache(model_id)
         
-        # Clear HuggingFace cache
-        hf_success = self.clear_model_cache(model_id)
+        # Sweep for the model dir and any remaining references from one listing,
+        # only when asked to or when the direct removal failed
+        if deep_clean or not hf_success:
+            try:
+                with os.scandir(self.hf_cache) as it:
+                    targets = [e for e in it if normalized_name in e.name and e.is_dir(follow_symlinks=False)]
+            except FileNotFoundError:
+                targets = []
+            
+            for item in targets:
+                removed = self._safe_remove(item.path)
+                if item.name == primary_name:
+                    hf_success = removed
+                    if removed:
+                        print(f"[CACHE] ✅ Cleared model cache: {item.path}")
+                    else:
+                        print(f"[CACHE] ⚠️  Could not fully clear model cache: {item.path}")
+                elif removed:
+                    print(f"[CACHE] ✅ Cleared remaining cache: {item.name}")
         
         # Clear CTranslate2 cache
         ctranslate_success = self.clear_ctranslate_cache(model_id)
         
-        # Also check for any remaining references in HF cache
-        if self.hf_cache.exists():
-            normalized_name = self._normalize_model_name(model_id)
-            for item in list(self.hf_cache.iterdir()):
-                if normalized_name in item.name and item.is_dir():
-                    if self._safe_remove(item):
-                        print(f"[CACHE] ✅ Cleared remaining cache: {item.name}")
-        
         return hf_success or ctranslate_success
     
     def get_cache_size(self, model_id: str) -> Optional[int]:
@@ -269,16 +406,9 @@ class CacheService:
         """
         model_cache = self.get_model_cache_path(model_id)
         
-        if not model_cache.exists():
-            return None
-        
-        total_size = 0
         try:
-            for root, dirs, files in os.walk(model_cache):
-                for f in files:
-                    file_path = Path(root) / f
-                    if file_path.exists():
-                        total_size += file_path.stat().st_size
+            # A missing cache surfaces as FileNotFoundError from scandir
+            total_size = sum(_map_entries(_entry_size, list(_iter_entries(model_cache))))
         except Exception:
             return None
         
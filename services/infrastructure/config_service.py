@@ -12,7 +12,7 @@ This module handles runtime configuration with device detection:
 ✅ This is for dynamic runtime configuration
 """
 import os
-import torch
+import functools
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -59,51 +59,132 @@ except ImportError:
 # ========== RUNTIME DEVICE DETECTION ==========
 # These are determined at runtime based on available hardware and .env file
 
-# Read device settings from .env file or use defaults
-LLM_DEVICE_ENV = os.getenv("LLM_DEVICE", "cuda").lower()
-TTS_DEVICE_ENV = os.getenv("TTS_DEVICE", "cuda").lower()
-WHISPER_DEVICE_ENV = os.getenv("WHISPER_DEVICE", "cuda").lower()
+_cuda_fully_available: Optional[bool] = None
 
-# Validate device values
-valid_devices = ["cuda", "cpu"]
-if LLM_DEVICE_ENV not in valid_devices:
-    print(f"[WARN] Invalid LLM_DEVICE={LLM_DEVICE_ENV}, defaulting to 'cuda'")
-    LLM_DEVICE_ENV = "cuda"
-if TTS_DEVICE_ENV not in valid_devices:
-    print(f"[WARN] Invalid TTS_DEVICE={TTS_DEVICE_ENV}, defaulting to 'cuda'")
-    TTS_DEVICE_ENV = "cuda"
-if WHISPER_DEVICE_ENV not in valid_devices:
-    print(f"[WARN] Invalid WHISPER_DEVICE={WHISPER_DEVICE_ENV}, defaulting to 'cuda'")
-    WHISPER_DEVICE_ENV = "cuda"
 
-# Check CUDA availability if any device requires it
-requires_cuda = LLM_DEVICE_ENV == "cuda" or TTS_DEVICE_ENV == "cuda" or WHISPER_DEVICE_ENV == "cuda"
-if requires_cuda and not torch.cuda.is_available():
-    raise SystemExit(
-        "[ERROR] CUDA is not available but required by device configuration.\n"
-        f"LLM_DEVICE={LLM_DEVICE_ENV}, TTS_DEVICE={TTS_DEVICE_ENV}, WHISPER_DEVICE={WHISPER_DEVICE_ENV}\n"
-        "Please ensure:\n"
-        "  1. NVIDIA GPU is installed and drivers are up to date\n"
-        "  2. CUDA toolkit is installed\n"
-        "  3. PyTorch with CUDA support is installed\n"
-        "  4. Or set LLM_DEVICE=cpu, TTS_DEVICE=cpu, and WHISPER_DEVICE=cpu in .env file\n"
-        "  5. Restart the application"
-    )
+def _check_cuda_fully_available() -> bool:
+    """
+    Check (once) that the CUDA runtime and cuDNN are usable.
+    
+    Uses the cheap availability queries rather than launching a kernel, so
+    no cuBLAS/cuDNN handles are created at import. Set VOICE_SKIP_CUDA_PROBE=1
+    to trust the device configuration and skip the check entirely.
+    """
+    global _cuda_fully_available
+    if _cuda_fully_available is None:
+        if os.getenv("VOICE_SKIP_CUDA_PROBE"):
+            _cuda_fully_available = True
+        else:
+            import torch  # Deferred: importing torch costs hundreds of ms
+            _cuda_fully_available = torch.cuda.is_available() and torch.backends.cudnn.is_available()
+    return _cuda_fully_available
+
+
+def _cuda_device_count() -> int:
+    """Number of visible CUDA devices (imports torch on demand)"""
+    import torch
+    return torch.cuda.device_count()
+
+
+@functools.lru_cache(maxsize=1)
+def _detect() -> Dict[str, str]:
+    """
+    Resolve device assignments and device-dependent Whisper settings (once).
+    
+    Runs on first access to LLM_DEVICE / TTS_DEVICE / WHISPER_DEVICE /
+    WHISPER_MODEL / WHISPER_COMPUTE_TYPE (via module __getattr__) or to
+    ConfigService device/model config, so importing this module for audio
+    or VAD constants does not pay for the CUDA probe.
+    """
+    # Read device settings from .env file or use defaults
+    llm_device = os.getenv("LLM_DEVICE", "cuda").lower()
+    tts_device = os.getenv("TTS_DEVICE", "cuda").lower()
+    whisper_device = os.getenv("WHISPER_DEVICE", "cuda").lower()
+    
+    # Validate device values
+    valid_devices = ["cuda", "cpu"]
+    if llm_device not in valid_devices:
+        print(f"[WARN] Invalid LLM_DEVICE={llm_device}, defaulting to 'cuda'")
+        llm_device = "cuda"
+    if tts_device not in valid_devices:
+        print(f"[WARN] Invalid TTS_DEVICE={tts_device}, defaulting to 'cuda'")
+        tts_device = "cuda"
+    if whisper_device not in valid_devices:
+        print(f"[WARN] Invalid WHISPER_DEVICE={whisper_device}, defaulting to 'cuda'")
+        whisper_device = "cuda"
+    
+    # Check CUDA availability if any device requires it
+    requires_cuda = llm_device == "cuda" or tts_device == "cuda" or whisper_device == "cuda"
+    if requires_cuda and not _check_cuda_fully_available():
+        raise SystemExit(
+            "[ERROR] CUDA is not available but required by device configuration.\n"
+            f"LLM_DEVICE={llm_device}, TTS_DEVICE={tts_device}, WHISPER_DEVICE={whisper_device}\n"
+            "Please ensure:\n"
+            "  1. NVIDIA GPU is installed and drivers are up to date\n"
+            "  2. CUDA toolkit is installed\n"
+            "  3. PyTorch with CUDA support is installed\n"
+            "  4. Or set LLM_DEVICE=cpu, TTS_DEVICE=cpu, and WHISPER_DEVICE=cpu in .env file\n"
+            "  5. Restart the application"
+        )
+    
+    # Print device configuration
+    device_summary = f"LLM: {llm_device}, TTS: {tts_device}, Whisper: {whisper_device}"
+    print(f"[INFO] Device configuration: {device_summary}")
+    if requires_cuda:
+        cuda_available = _check_cuda_fully_available()
+        print(f"[INFO] CUDA available: {cuda_available}")
+        if cuda_available and not os.getenv("VOICE_SKIP_CUDA_PROBE"):
+            import torch
+            print(f"[INFO] CUDA device: {torch.cuda.get_device_name(0)}")
+            print(f"[INFO] CUDA version: {torch.version.cuda}")
+    
+    # Whisper model (see RUNTIME MODEL CONFIGURATION notes below)
+    if whisper_device == "cuda":
+        # GPU: Use "large-v3-turbo" or "distil-whisper/distil-large-v3" for ultra-low latency + multilingual
+        # Both support English, Hindi, Gujarati and many other languages
+        # Can be overridden via WHISPER_MODEL environment variable
+        whisper_model = os.getenv("WHISPER_MODEL", "large-v3-turbo")
+    else:
+        # CPU: use smaller multilingual model for better performance
+        # For ultra-low latency on CPU, use "base" (multilingual) or "small" (multilingual)
+        # Avoid ".en" models if you need Hindi/Gujarati support
+        whisper_model = os.getenv("WHISPER_MODEL", "base")
+    
+    # Whisper compute type (optimized for device)
+    # For CUDA (RTX 3050/3080/5080): "int8_float16" (LOWEST LATENCY - uses Tensor Cores)
+    # For CUDA (other GPUs): "float16" (good balance)
+    # For CPU: "int8" (memory efficient) - CPU does NOT support int8_float16 or float16
+    # Use WHISPER_DEVICE to match actual device being used
+    env_compute_type = os.getenv("WHISPER_COMPUTE_TYPE")
+    if whisper_device == "cuda":
+        # GPU: default to "int8_float16" for RTX GPUs (best performance)
+        # Can be overridden via WHISPER_COMPUTE_TYPE env var to "float16" or "int8"
+        whisper_compute_type = env_compute_type if env_compute_type else "int8_float16"
+        print(f"[STT] Using GPU with compute type: {whisper_compute_type}")
+    else:
+        # CPU: only allow int8 (int8_float16 and float16 are not supported on CPU)
+        if env_compute_type in ["int8_float16", "float16"]:
+            print(f"[WARNING] WHISPER_COMPUTE_TYPE={env_compute_type} is not supported on CPU.")
+            print(f"[WARNING] Falling back to 'int8' for CPU compatibility.")
+            whisper_compute_type = "int8"
+        else:
+            whisper_compute_type = env_compute_type if env_compute_type else "int8"
+    
+    return {
+        "LLM_DEVICE": llm_device,
+        "TTS_DEVICE": tts_device,
+        "WHISPER_DEVICE": whisper_device,
+        "WHISPER_MODEL": whisper_model,
+        "WHISPER_COMPUTE_TYPE": whisper_compute_type,
+    }
+
 
-# Device assignments from .env or defaults
-LLM_DEVICE = LLM_DEVICE_ENV
-TTS_DEVICE = TTS_DEVICE_ENV
-WHISPER_DEVICE = WHISPER_DEVICE_ENV
+def __getattr__(name: str):
+    """Resolve device-dependent settings lazily (PEP 562)"""
+    if name in ("LLM_DEVICE", "TTS_DEVICE", "WHISPER_DEVICE", "WHISPER_MODEL", "WHISPER_COMPUTE_TYPE"):
+        return _detect()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Print device configuration
-device_summary = f"LLM: {LLM_DEVICE}, TTS: {TTS_DEVICE}, Whisper: {WHISPER_DEVICE}"
-print(f"[INFO] Device configuration: {device_summary}")
-if LLM_DEVICE == "cuda" or TTS_DEVICE == "cuda" or WHISPER_DEVICE == "cuda":
-    cuda_available = torch.cuda.is_available()
-    print(f"[INFO] CUDA available: {cuda_available}")
-    if cuda_available:
-        print(f"[INFO] CUDA device: {torch.cuda.get_device_name(0)}")
-        print(f"[INFO] CUDA version: {torch.version.cuda}")
 
 # ========== RUNTIME AUDIO CONFIGURATION ==========
 # These can be changed at runtime or via environment variables
@@ -135,39 +216,10 @@ VOICE_CLONE_WAV = os.getenv("VOICE_CLONE_WAV", "data/saved_voices/refe2.wav")
 # - "large-v3": ~800-2000ms, highest accuracy, multilingual (slower)
 # - "base.en": ~100-200ms, good accuracy, English only ❌ (no Hindi/Gujarati)
 # - "small.en": ~200-400ms, better accuracy, English only ❌ (no Hindi/Gujarati)
-if WHISPER_DEVICE == "cuda":
-    # GPU: Use "large-v3-turbo" or "distil-whisper/distil-large-v3" for ultra-low latency + multilingual
-    # Both support English, Hindi, Gujarati and many other languages
-    # Can be overridden via WHISPER_MODEL environment variable
-    WHISPER_MODEL = os.getenv("WHISPER_MODEL", "large-v3-turbo")
-else:
-    # CPU: use smaller multilingual model for better performance
-    # For ultra-low latency on CPU, use "base" (multilingual) or "small" (multilingual)
-    # Avoid ".en" models if you need Hindi/Gujarati support
-    WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+# WHISPER_MODEL and WHISPER_COMPUTE_TYPE depend on WHISPER_DEVICE and are resolved in _detect()
 LLM_MODEL = os.getenv("LLM_MODEL", "TinyLlama/TinyLlama-1.1B-Chat-v1.0")
 XTTS_MODEL = os.getenv("XTTS_MODEL", "tts_models/multilingual/multi-dataset/xtts_v2")
 
-# Whisper compute type (optimized for device)
-# For CUDA (RTX 3050/3080/5080): "int8_float16" (LOWEST LATENCY - uses Tensor Cores)
-# For CUDA (other GPUs): "float16" (good balance)
-# For CPU: "int8" (memory efficient) - CPU does NOT support int8_float16 or float16
-# Use WHISPER_DEVICE to match actual device being used
-env_compute_type = os.getenv("WHISPER_COMPUTE_TYPE")
-if WHISPER_DEVICE == "cuda":
-    # GPU: default to "int8_float16" for RTX GPUs (best performance)
-    # Can be overridden via WHISPER_COMPUTE_TYPE env var to "float16" or "int8"
-    WHISPER_COMPUTE_TYPE = env_compute_type if env_compute_type else "int8_float16"
-    print(f"[STT] Using GPU with compute type: {WHISPER_COMPUTE_TYPE}")
-else:
-    # CPU: only allow int8 (int8_float16 and float16 are not supported on CPU)
-    if env_compute_type in ["int8_float16", "float16"]:
-        print(f"[WARNING] WHISPER_COMPUTE_TYPE={env_compute_type} is not supported on CPU.")
-        print(f"[WARNING] Falling back to 'int8' for CPU compatibility.")
-        WHISPER_COMPUTE_TYPE = "int8"
-    else:
-        WHISPER_COMPUTE_TYPE = env_compute_type if env_compute_type else "int8"
-
 # ========== RUNTIME LANGUAGE CONFIGURATION ==========
 # Language for speech transcription (supports: en, hi, gu, and 99+ languages)
 # 
@@ -213,12 +265,14 @@ class ConfigService:
         Returns:
             Dictionary with device assignments for LLM, TTS, and Whisper
         """
+        devices = _detect()
+        cuda_available = _check_cuda_fully_available()
         return {
-            "llm_device": LLM_DEVICE,
-            "tts_device": TTS_DEVICE,
-            "whisper_device": WHISPER_DEVICE,
-            "cuda_available": str(torch.cuda.is_available()),
-            "cuda_device_count": str(torch.cuda.device_count()) if torch.cuda.is_available() else "0",
+            "llm_device": devices["LLM_DEVICE"],
+            "tts_device": devices["TTS_DEVICE"],
+            "whisper_device": devices["WHISPER_DEVICE"],
+            "cuda_available": str(cuda_available),
+            "cuda_device_count": str(_cuda_device_count()) if cuda_available else "0",
         }
     
     @staticmethod
@@ -244,10 +298,11 @@ class ConfigService:
         Returns:
             Dictionary with model names, compute types, and language settings
         """
+        devices = _detect()
         return {
-            "whisper_model": WHISPER_MODEL,
-            "whisper_device": WHISPER_DEVICE,
-            "whisper_compute_type": WHISPER_COMPUTE_TYPE,
+            "whisper_model": devices["WHISPER_MODEL"],
+            "whisper_device": devices["WHISPER_DEVICE"],
+            "whisper_compute_type": devices["WHISPER_COMPUTE_TYPE"],
             "whisper_language": WHISPER_LANGUAGE or "auto-detect",
             "llm_model": LLM_MODEL,
             "tts_model": XTTS_MODEL,
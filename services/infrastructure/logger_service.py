@@ -10,20 +10,107 @@ Centralized logging configuration for the voice platform:
 This service handles all logging concerns, ensuring consistent log format
 across the application.
 """
+import time
+import queue
+import atexit
 import logging
+import threading
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 64 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Background listener that drains the log queue into the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a 64 KB buffer.
+    
+    Runs on the QueueListener thread. Tracks the file size itself (the stock
+    rollover check seeks the stream, which forces a flush per record) and
+    flushes at most once per FLUSH_INTERVAL seconds. A deferred flush is
+    scheduled on a timer so buffered records reach disk within the interval
+    even if logging goes quiet; WARNING and above are flushed immediately.
+    """
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 1.0
+    _pending = 0  # Formatted length of the record being emitted
+    _flush_timer: Optional[threading.Timer] = None
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.seek(0, 2)
+        self._last_flush = time.monotonic()
+        return stream
+    
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        self._pending = len(self.format(record)) + len(self.terminator)
+        return 0 < self.maxBytes <= self._size + self._pending
+    
+    def emit(self, record) -> None:
+        super().emit(record)
+        self._size += self._pending
+        if record.levelno >= logging.WARNING:
+            self._flush_now()
+    
+    def flush(self) -> None:
+        elapsed = time.monotonic() - self._last_flush
+        if elapsed >= self.FLUSH_INTERVAL:
+            self._flush_now()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_INTERVAL - elapsed, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_now(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+    
+    def _timed_flush(self) -> None:
+        """Timer callback: flush whatever is still buffered"""
+        with self.lock:
+            self._flush_timer = None
+            self._flush_now()
+    
+    def close(self) -> None:
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
+
+
+def _stop_listener() -> None:
+    """Drain queued records and flush file handlers (registered with atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 
 def setup_logging(log_dir: Optional[str] = None, log_file: str = "assistant.log") -> logging.Logger:
     """
     Setup comprehensive logging configuration
     
     Configures:
-    - File handler with rotation support
+    - File handler with rotation support (64 MB x 5, buffered)
     - Console handler for real-time output
     - Standardized format with timestamps
     
+    Records are enqueued by a QueueHandler and written by a background
+    QueueListener, so callers never block on disk I/O. The listener is
+    available as ``logger.queue_listener`` and is stopped at exit.
+    
     Args:
         log_dir: Directory for log files (defaults to project_root/logs)
         log_file: Name of the log file
@@ -40,16 +127,35 @@ def setup_logging(log_dir: Optional[str] = None, log_file: str = "assistant.log"
         log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path / log_file),
-            logging.StreamHandler()
-        ]
-    )
+    # The format never uses thread/process fields; skip those lookups per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    global _listener
+    if _listener is None:
+        formatter = logging.Formatter(LOG_FORMAT)
+        file_handler = _BufferedRotatingFileHandler(
+            log_path / log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+        )
+        console_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_stop_listener)
+        
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final format applied by listener handlers
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
     
-    return logging.getLogger(__name__)
+    logger = logging.getLogger(__name__)
+    logger.queue_listener = _listener
+    return logger
 
 
 def log_conversation(
@@ -73,7 +179,7 @@ def log_conversation(
     if logger is None:
         logger = logging.getLogger(__name__)
     
-    logger.info(f"USER: {user_text}")
-    logger.info(f"BOT: {bot_reply}")
-    logger.info(f"ORDER: {order_state}")
+    # One deferred-format record; skip building it entirely when INFO is filtered
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("USER: %s | BOT: %s | ORDER: %s", user_text, bot_reply, order_state)
 
@@ -5,10 +5,33 @@ Collection and reporting of application metrics.
 """
 
 from typing import Dict, Optional
-from collections import defaultdict
 import time
 
 
+class _MetricEntry:
+    """
+    All state for one metric name: counter, last recorded value, and running
+    timing aggregates. Unused parts stay None.
+    """
+    __slots__ = ('count', 'value', 'n', 'sum', 'min', 'max')
+    
+    def __init__(self):
+        self.count = None    # Counter total (increment)
+        self.value = None    # Last recorded value (record)
+        self.n = 0           # Timing aggregates (end_timer)
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def add_timing(self, duration: float):
+        self.n += 1
+        self.sum += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+
+
 class MetricsService:
     """
     Metrics collection and reporting service.
@@ -18,9 +41,14 @@ class MetricsService:
     
     def __init__(self):
         """Initialize metrics service"""
-        self._metrics = defaultdict(float)
-        self._counts = defaultdict(int)
-        self._timings = defaultdict(list)
+        self._entries: Dict[str, _MetricEntry] = {}
+    
+    def _entry(self, metric_name: str) -> _MetricEntry:
+        """Get or create the entry for a metric (single lookup on the hit path)"""
+        entry = self._entries.get(metric_name)
+        if entry is None:
+            entry = self._entries[metric_name] = _MetricEntry()
+        return entry
     
     def increment(self, metric_name: str, value: int = 1):
         """
@@ -30,7 +58,8 @@ class MetricsService:
             metric_name: Name of the metric
             value: Value to increment by (default: 1)
         """
-        self._counts[metric_name] += value
+        entry = self._entry(metric_name)
+        entry.count = (entry.count or 0) + value
     
     def record(self, metric_name: str, value: float):
         """
@@ -40,9 +69,9 @@ class MetricsService:
             metric_name: Name of the metric
             value: Value to record
         """
-        self._metrics[metric_name] = value
+        self._entry(metric_name).value = value
     
-    def start_timer(self, metric_name: str) -> float:
+    def start_timer(self, metric_name: str) -> int:
         """
         Start a timer for a metric.
         
@@ -50,21 +79,21 @@ class MetricsService:
             metric_name: Name of the timing metric
             
         Returns:
-            Start time (can be used with end_timer)
+            Opaque perf_counter_ns start value; only meaningful when
+            passed back to end_timer, not as a wall-clock time
         """
-        start_time = time.time()
-        return start_time
+        return time.perf_counter_ns()
     
-    def end_timer(self, metric_name: str, start_time: float):
+    def end_timer(self, metric_name: str, start_time: int):
         """
         End a timer and record the duration.
         
         Args:
             metric_name: Name of the timing metric
-            start_time: Start time returned from start_timer
+            start_time: Value returned from start_timer
         """
-        duration = time.time() - start_time
-        self._timings[metric_name].append(duration)
+        duration = (time.perf_counter_ns() - start_time) / 1e9
+        self._entry(metric_name).add_timing(duration)
     
     def get_metric(self, metric_name: str) -> Optional[float]:
         """
@@ -76,11 +105,12 @@ class MetricsService:
         Returns:
             Metric value or None if not found
         """
-        if metric_name in self._metrics:
-            return self._metrics[metric_name]
-        if metric_name in self._counts:
-            return self._counts[metric_name]
-        return None
+        entry = self._entries.get(metric_name)
+        if entry is None:
+            return None
+        if entry.value is not None:
+            return entry.value
+        return entry.count
     
     def get_timing_stats(self, metric_name: str) -> Optional[Dict[str, float]]:
         """
@@ -92,15 +122,15 @@ class MetricsService:
         Returns:
             Dictionary with min, max, avg, count or None if not found
         """
-        if metric_name not in self._timings or not self._timings[metric_name]:
+        entry = self._entries.get(metric_name)
+        if entry is None or not entry.n:
             return None
         
-        timings = self._timings[metric_name]
         return {
-            'min': min(timings),
-            'max': max(timings),
-            'avg': sum(timings) / len(timings),
-            'count': len(timings)
+            'min': entry.min,
+            'max': entry.max,
+            'avg': entry.sum / entry.n,
+            'count': entry.n
         }
     
     def get_all_metrics(self) -> Dict[str, any]:
@@ -110,15 +140,13 @@ class MetricsService:
         Returns:
             Dictionary with all metrics
         """
+        entries = self._entries.items()
         return {
-            'metrics': dict(self._metrics),
-            'counts': dict(self._counts),
-            'timings': {k: self.get_timing_stats(k) for k in self._timings.keys()}
+            'metrics': {k: e.value for k, e in entries if e.value is not None},
+            'counts': {k: e.count for k, e in entries if e.count is not None},
+            'timings': {k: self.get_timing_stats(k) for k, e in entries if e.n}
         }
     
     def reset(self):
         """Reset all metrics"""
-        self._metrics.clear()
-        self._counts.clear()
-        self._timings.clear()
-
+        self._entries.clear()
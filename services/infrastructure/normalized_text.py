@@ -0,0 +1,32 @@
+"""
+Normalized text value object
+
+Lowercases and tokenizes a user utterance once so the dialog, policy and
+entity services can share the result instead of re-deriving it per call.
+"""
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedText:
+    """Immutable, precomputed views of a single user utterance"""
+    raw: str
+    lower: str
+    words: Tuple[str, ...]
+
+    @classmethod
+    def from_raw(cls, text: str) -> "NormalizedText":
+        """Build all views of ``text`` in one pass"""
+        lower = text.lower()
+        return cls(raw=text, lower=lower, words=tuple(lower.split()))
+
+    @classmethod
+    def ensure(cls, text: Union[str, "NormalizedText"]) -> "NormalizedText":
+        """Return ``text`` unchanged if already normalized, else normalize it"""
+        if isinstance(text, cls):
+            return text
+        return cls.from_raw(text)
+
+    def __str__(self) -> str:
+        return self.raw
@@ -12,11 +12,15 @@ This service:
 """
 import torch
 import time
+import threading
 import numpy as np
 from typing import Tuple, Optional
 
 from .config_service import VAD_THRESHOLD, MAX_SILENCE, SAMPLE_RATE
 
+# Silero VAD window size at 16 kHz
+VAD_FRAME_SAMPLES = 512
+
 
 class VADService:
     """
@@ -24,12 +28,55 @@ class VADService:
     
     Detects speech in audio frames and provides speech probability scores.
     Used by AudioProcessor to determine when to start/stop recording.
+    
+    The model loads and warms up on a background thread; detection calls
+    block only if it is not ready yet.
     """
     
+    _shared: Optional["VADService"] = None
+    _shared_lock = threading.Lock()
+    
     def __init__(self):
         self.model = None
         self.utils = None
-        self._load_model()
+        # Persistent input window; _frame_np shares its memory, so frames are
+        # copied in place instead of allocating pad/concat/cast arrays per call
+        self._frame = torch.zeros(VAD_FRAME_SAMPLES, dtype=torch.float32)
+        self._frame_np = self._frame.numpy()
+        self._ready = threading.Event()
+        self._load_error: Optional[BaseException] = None
+        threading.Thread(target=self._load_and_warm, name="vad-prefetch", daemon=True).start()
+    
+    @classmethod
+    def prefetch(cls) -> "VADService":
+        """
+        Start loading the shared VAD model now (e.g. at platform init)
+        
+        Returns the shared instance; later calls return the same one.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def _load_and_warm(self):
+        """Load the model and run one dummy window so the first real frame is fast"""
+        try:
+            self._load_model()
+            with torch.inference_mode():
+                self.model(torch.zeros(VAD_FRAME_SAMPLES, dtype=torch.float32), SAMPLE_RATE)
+            self.reset_states()
+        except BaseException as e:
+            self._load_error = e
+        finally:
+            self._ready.set()
+    
+    def _wait_ready(self):
+        """Block until the background load finishes; re-raise a load failure"""
+        if not self._ready.is_set():
+            self._ready.wait()
+        if self._load_error is not None:
+            raise RuntimeError("VAD model failed to load") from self._load_error
     
     def _load_model(self):
         """Load Silero VAD model"""
@@ -39,6 +86,26 @@ class VADService:
             trust_repo=True,
             force_reload=False,
         )
+        self.model = self._specialize_model(self.model)
+    
+    @staticmethod
+    def _specialize_model(model):
+        """
+        Freeze the scripted Silero model for inference.
+        
+        Done in-process on every load (on the prefetch thread) rather than
+        cached on disk, so a hub update to the checkpoint is always picked up.
+        Falls back to the hub model if it is not TorchScript or freezing fails.
+        """
+        model.eval()
+        if not isinstance(model, torch.jit.ScriptModule):
+            return model
+        
+        try:
+            return torch.jit.freeze(model, preserved_attrs=["reset_states"])
+        except Exception as e:
+            print(f"[VAD] ⚠️  Could not freeze VAD model, using it as loaded: {e}")
+            return model
     
     def detect_speech(
         self, 
@@ -48,6 +115,10 @@ class VADService:
         """
         Detect speech probability in audio frame
         
+        Contiguous float32 frames of at least 512 samples (what AudioProcessor
+        reads from its float32 input stream) take a zero-copy fast path: the
+        model reads the last 512 samples in place.
+        
         Args:
             audio_frame: Audio frame as numpy array
             threshold: Speech detection threshold
@@ -57,25 +128,37 @@ class VADService:
         """
         if audio_frame.size == 0:
             return 0.0
+        self._wait_ready()
         
-        # Prepare frame for VAD (needs 512 samples)
-        if audio_frame.shape[0] > 512:
-            recent = audio_frame[-512:]
-        elif audio_frame.shape[0] < 512:
-            pad = np.zeros(512 - audio_frame.shape[0], dtype=audio_frame.dtype)
-            recent = np.concatenate([pad, audio_frame])
+        n = audio_frame.shape[0]
+        if (
+            n >= VAD_FRAME_SAMPLES
+            and audio_frame.dtype == np.float32
+            and audio_frame.flags.c_contiguous
+            and audio_frame.flags.writeable
+        ):
+            # Steady-state frame: view the tail directly, no copy
+            frame = torch.from_numpy(audio_frame[-VAD_FRAME_SAMPLES:])
         else:
-            recent = audio_frame
+            # Prepare frame for VAD (needs 512 samples, left-padded with zeros);
+            # Silero takes float32 audio in [-1, 1] directly
+            if n >= VAD_FRAME_SAMPLES:
+                self._frame_np[:] = audio_frame[-VAD_FRAME_SAMPLES:]
+            else:
+                self._frame_np[:VAD_FRAME_SAMPLES - n] = 0.0
+                self._frame_np[VAD_FRAME_SAMPLES - n:] = audio_frame
+            frame = self._frame
         
-        # Convert to int16 format
-        wav_int16 = (recent * 32768).astype(np.int16)
-        torch_audio = torch.from_numpy(wav_int16).float()
-        
-        with torch.no_grad():
-            speech_prob = self.model(torch_audio, SAMPLE_RATE).item()
+        with torch.inference_mode():
+            speech_prob = self.model(frame, SAMPLE_RATE).item()
         
         return speech_prob
     
+    def reset_states(self):
+        """Reset the model's recurrent state (call between utterances)"""
+        if hasattr(self.model, "reset_states"):
+            self.model.reset_states()
+    
     def is_silence(
         self, 
         audio_frame: np.ndarray, 
@@ -5,7 +5,10 @@ This manager depends on interfaces, not concrete implementations.
 Changes to service implementations won't affect this manager.
 """
 import re
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple, Union
+
+from core.keyword_matcher import build_keyword_matcher
+from services.infrastructure.normalized_text import NormalizedText
 
 # Use interfaces for stable contracts
 try:
@@ -25,6 +28,43 @@ except ImportError:
     from services.business.policy_service import PolicyService as IPolicyService
 
 
+# Keyword groups for each dialog branch (plain substring semantics)
+_INTENT_KEYWORDS = {
+    "ordering": ("order", "want", "get", "add"),
+    "clear": ("clear order", "reset order", "cancel all", "start over"),
+    "remove": ("remove", "without", "don't add", "cancel the", "delete"),
+    "update": ("change to", "make it", "update to"),
+    "add": ("i want", "i need", "i would like", "can i get", "order", "add", "get me", "put in", "give me"),
+    "summary": ("total", "bill", "amount", "my order", "cart", "summary"),
+    "restaurant": ("restaurant",),
+    "name": ("name",),
+    "your_restaurant": ("your restaurant",),
+    "address": ("address", "location", "where are you", "where is your restaurant", "address of your restaurant"),
+    "phone": ("phone", "mobile", "contact", "number"),
+    "menu": ("menu", "dishes", "items", "food list", "what do you have", "what's available"),
+    "price": ("price", "cost", "rupees", "rs", "₹", "amount for", "rate"),
+    "describe": ("what is", "tell me about", "describe", "what's in"),
+    "recipe": ("how to make", "how do you make", "how is it made", "how it's made", "recipe"),
+    "veg": ("veg option", "vegetable option", "vegetarian option", "veg options", "vegetable options"),
+    "beverage": ("drink", "beverage", "coffee", "tea", "soda", "cold drink"),
+    "allergen": ("allergen", "allergy", "contains", "dairy", "nuts", "gluten"),
+    "variant": ("size", "variant", "option", "available size", "what size"),
+    "addon": ("addon", "extra", "can i add", "what can i add", "add to"),
+}
+
+# Returns every intent whose keywords occur in the (lowercased) text, in one regex scan
+_match_intents = build_keyword_matcher(_INTENT_KEYWORDS)
+
+# Leading quantity words stripped from a dish phrase before retrying a match
+_QTY_STRIP_RE = re.compile(r'\b(one|two|three|four|five|six|seven|eight|nine|ten|\d+)\s+')
+# "21 gulab jamun" style quantity + item phrases
+_QTY_ITEM_RE = re.compile(r'\b(\d+)\s+([a-z\s]+)\b')
+# Intent set merged in when "restaurant" and "name" both match
+_YOUR_RESTAURANT = frozenset(("your_restaurant",))
+# Menu item name fragments that mark a dish as vegetarian
+_VEG_NAME_RE = re.compile("paneer|veg|dal|aloo|mushroom|gobi|sabzi")
+
+
 class DialogManager:
     """
     Manages conversation state and dialog flow
@@ -52,9 +92,45 @@ class DialogManager:
         self.entity_service = entity_service
         self.action_service = action_service
         self.policy_service = policy_service
+        # (menu version, id(item) -> (item, compiled variant/addon matchers))
+        self._item_pattern_cache: Tuple[int, Dict[int, Tuple]] = (-1, {})
+        # (limit_per_category, menu version) -> suggestion string
+        self._menu_cache: Dict[Tuple[Optional[int], int], str] = {}
+        # (menu version, vegetarian item names)
+        self._veg_cache: Tuple[int, List[str]] = (-1, [])
+        # (menu version, ((lowercased category name, category reply), ...))
+        self._category_cache: Tuple[int, Tuple[Tuple[str, str], ...]] = (-1, ())
+        # (intent, handler) in priority order; None = tried regardless of intent.
+        # A handler returns a reply, or None to fall through to the next one.
+        self._dispatch: Tuple[Tuple[Optional[str], Callable], ...] = (
+            ("clear", self._handle_clear),
+            ("remove", self._handle_remove),
+            ("update", self._handle_update),
+            ("add", self._handle_add),
+            ("summary", self._handle_summary),
+            ("your_restaurant", self._handle_restaurant_name),
+            ("address", self._handle_address),
+            ("phone", self._handle_phone),
+            ("menu", self._handle_menu),
+            ("price", self._handle_price),
+            ("describe", self._handle_describe),
+            ("recipe", self._handle_recipe),
+            ("veg", self._handle_veg),
+            (None, self._handle_quantity_phrase),
+            (None, self._handle_dish_name),
+            ("beverage", self._handle_beverage),
+            ("allergen", self._handle_allergen),
+            ("variant", self._handle_variant),
+            ("addon", self._handle_addon),
+        )
     
     def menu_suggestion_string(self, limit_per_category: Optional[int] = None) -> str:
-        """Build menu suggestion string"""
+        """Build menu suggestion string (cached per menu version)"""
+        key = (limit_per_category, self.menu_repo.version())
+        cached = self._menu_cache.get(key)
+        if cached is not None:
+            return cached
+        
         parts = []
         for c in self.menu_repo.get_menu():
             items_list = c.get("items", [])
@@ -63,26 +139,59 @@ class DialogManager:
             names = ", ".join(i["name"] for i in items_list)
             if names:
                 parts.append(f"{c['name']}: {names}")
-        return " | ".join(parts) if parts else "our current menu items."
+        result = " | ".join(parts) if parts else "our current menu items."
+        if len(self._menu_cache) >= 16:  # Stale versions only; keep it tiny
+            self._menu_cache.clear()
+        self._menu_cache[key] = result
+        return result
+    
+    def _veg_item_names(self) -> List[str]:
+        """Names of vegetarian menu items (cached per menu version)"""
+        version = self.menu_repo.version()
+        if self._veg_cache[0] != version:
+            veg_items = []
+            for _, item in self.menu_repo.all_menu_items():
+                name_low = item["name"].lower()
+                if _VEG_NAME_RE.search(name_low):
+                    veg_items.append(item["name"])
+            self._veg_cache = (version, veg_items)
+        return self._veg_cache[1]
+    
+    def _category_replies(self) -> Tuple[Tuple[str, str], ...]:
+        """Lowercased category names with their item-list replies (cached per menu version)"""
+        version = self.menu_repo.version()
+        if self._category_cache[0] != version:
+            replies = tuple(
+                (cat["name"].lower(), f"{cat['name']}: " + ", ".join(i["name"] for i in cat["items"]))
+                for cat in self.menu_repo.get_menu()
+            )
+            self._category_cache = (version, replies)
+        return self._category_cache[1]
     
     def unavailable_item_fallback(self) -> str:
         """Response when item not found"""
         return f"Sorry, we don't have that item. Could you please specify the exact dish name you want?"
     
-    def process_message(self, text: str, order: IOrderManager) -> Optional[str]:
+    def process_message(self, text: Union[str, NormalizedText], order: IOrderManager) -> Optional[str]:
         """
         Process user message and return response.
         Returns None if message should be handled by LLM.
         """
+        norm = NormalizedText.ensure(text)
+        
         # Apply phonetic corrections first
-        text_low = self.entity_service.apply_phonetic_corrections(text)
+        text_low = self.entity_service.apply_phonetic_corrections(norm)
         text = text_low  # Use corrected text for processing
+        if text_low != norm.lower:
+            norm = NormalizedText.from_raw(text_low)
         
-        rest = self.menu_repo.get_restaurant_info()
+        intents = _match_intents(text_low)
+        if "restaurant" in intents and "name" in intents:
+            intents = intents | _YOUR_RESTAURANT  # "restaurant ... name" asks the same thing
         
         # 1. Check restaurant hours
         is_open, closed_msg = self.policy_service.is_restaurant_open()
-        if not is_open and any(kw in text_low for kw in ["order", "want", "get", "add"]):
+        if not is_open and "ordering" in intents:
             return closed_msg
         
         # 2. Handle order finalization
@@ -90,309 +199,370 @@ class DialogManager:
         if success and msg:
             return msg
         
-        # 3. CLEAR ORDER
-        if any(p in text_low for p in ["clear order", "reset order", "cancel all", "start over"]):
-            order.clear()
-            return "I've cleared your entire order. Would you like to start fresh?"
+        # 3-19. Handlers in priority order; the first reply wins, None falls through
+        for intent, handler in self._dispatch:
+            if intent is None or intent in intents:
+                reply = handler(norm, order)
+                if reply is not None:
+                    return reply
         
-        # 4. REMOVE specific items
-        if any(p in text_low for p in ["remove", "without", "don't add", "cancel the", "delete"]):
-            matches = self.entity_service.find_all_dish_matches(text_low)
-            if matches:
-                qty = self.entity_service.extract_quantity(text_low, default=None)
-                removed = []
-                for _, item, _ in matches:
-                    order.remove_item(item["name"], qty)
-                    removed.append(item["name"])
-                
-                if order.is_empty():
-                    return f"I removed {', '.join(removed)}. Your order is now empty."
-                else:
-                    return f"I removed {', '.join(removed)}. {order.describe_order()}"
-            return "I couldn't find that item in your order."
-        
-        # 5. UPDATE quantity
-        if any(kw in text_low for kw in ["change to", "make it", "update to"]):
-            qty = self.entity_service.extract_quantity(text_low)
-            matches = self.entity_service.find_all_dish_matches(text_low)
-            if matches:
-                _, item, _ = matches[0]
-                if order.update_quantity(item["name"], qty):
-                    return f"Updated {item['name']} to {qty}. {order.describe_order()}"
-                else:
-                    return f"{item['name']} is not in your order yet. Would you like to add it?"
-        
-        # 6. ADD items with quantity
-        if any(p in text_low for p in ["i want", "i need", "i would like", "can i get", "order", "add", "get me", "put in", "give me"]):
-            # Detect if multiple dishes mentioned
-            dish_phrases = self.entity_service.detect_multiple_dishes(text_low)
-            
-            added_names = []
-            total_qty = 0
-            
-            for dish_phrase in dish_phrases:
-                # Extract quantity for this specific dish phrase
-                qty = self.entity_service.extract_quantity(dish_phrase, default=1)
-                
-                # Find matches for this specific dish phrase
-                matches = self.entity_service.find_all_dish_matches(dish_phrase)
-                
-                if not matches:
-                    # Try without quantity words
-                    dish_phrase_clean = re.sub(r'\b(one|two|three|four|five|six|seven|eight|nine|ten|\d+)\s+', '', dish_phrase).strip()
-                    matches = self.entity_service.find_all_dish_matches(dish_phrase_clean)
-                
-                if matches:
-                    # Take only the best match for this phrase
-                    best_match = matches[0]
-                    _, item, score = best_match
-                    
-                    if score >= 0.7:  # Good match threshold
-                        # Check availability
-                        available, avail_msg = self.policy_service.check_item_availability(item["name"])
-                        if not available:
-                            return avail_msg
-                        
-                        # Detect variant (e.g., "large", "regular", "boneless")
-                        variant = self._detect_variant(dish_phrase, item)
-                        
-                        # Detect addons (e.g., "with extra cheese", "with raita")
-                        addons = self._detect_addons(dish_phrase, item)
-                        
-                        # Get price based on variant
-                        base_price = self._get_item_price(item, variant)
-                        
-                        # Calculate total price including addons
-                        total_price = base_price
-                        if addons:
-                            addon_prices = {a["name"]: a["price"] for a in item.get("addons", [])}
-                            for addon_name in addons:
-                                if addon_name in addon_prices:
-                                    total_price += addon_prices[addon_name]
-                        
-                        # Get allergens
-                        allergens = item.get("allergens", [])
-                        
-                        # Add to order with full details
-                        order.add_item(
-                            item["name"], 
-                            total_price, 
-                            qty,
-                            variant=variant,
-                            addons=addons,
-                            allergens=allergens,
-                            item_id=item.get("id")
-                        )
-                        
-                        # Build description for confirmation
-                        item_desc = item['name']
-                        if variant:
-                            item_desc += f" ({variant})"
-                        if addons:
-                            item_desc += f" with {', '.join(addons)}"
-                        added_names.append(f"{qty} {item_desc}")
-                        total_qty += qty
-            
-            if not added_names:
-                return self.unavailable_item_fallback()
-            
-            added_str = ", ".join(added_names)
-            return f"Great! I've added {added_str}. {order.describe_order()}"
-        
-        # 7. ORDER SUMMARY / TOTAL
-        if any(p in text_low for p in ["total", "bill", "amount", "my order", "cart", "summary"]):
-            return order.describe_order()
-        
-        # Restaurant name
-        if ("restaurant" in text_low and "name" in text_low) or "your restaurant" in text_low:
-            if rest:
-                return f"Our restaurant name is {rest.get('name', 'Infocall Dine')}."
-
-        # Address / location
-        if any(k in text_low for k in ["address", "location", "where are you", "where is your restaurant", "address of your restaurant"]):
-            if rest:
-                return f"We are located at {rest.get('address', 'MG Road, Mumbai')}."
-
-        # Phone / contact
-        if any(k in text_low for k in ["phone", "mobile", "contact", "number"]):
-            if rest:
-                return f"You can reach us at {rest.get('phone', '+91 98765 43210')}."
-        
-        # 9. Menu queries
-        if any(k in text_low for k in ["menu", "dishes", "items", "food list", "what do you have", "what's available"]):
-            # Category-specific handling
-            for cat in self.menu_repo.get_menu():
-                cat_name = cat["name"].lower()
-                if cat_name in text_low:
-                    names = ", ".join(i["name"] for i in cat["items"])
-                    return f"{cat['name']}: {names}"
-            
-            suggestions = self.menu_suggestion_string(limit_per_category=2)
-            return "Here's our menu: " + suggestions
-        
-        # 10. Price queries
-        if any(k in text_low for k in ["price", "cost", "rupees", "rs", "₹", "amount for", "rate"]):
-            matches = self.entity_service.find_all_dish_matches(text)
-            if matches:
-                prices = []
-                for _, item, score in matches:
-                    if score >= 0.7:
-                        prices.append(f"{item['name']} costs {item['price']} rupees")
-                if prices:
-                    return " | ".join(prices)
-            return "I'm not sure which dish you're asking about. Could you please say the exact dish name?"
-        
-        # 11. Dish description (enhanced with variants, addons, allergens)
-        if any(k in text_low for k in ["what is", "tell me about", "describe", "what's in"]):
-            _, item, score = self.entity_service.best_dish_match(text)
-            if item and score >= 0.7:
-                desc = item.get("description", "No description available")
-                price_info = f"Price: {item['price']} rupees"
-                
-                # Add variant info if available
-                variants = item.get("variants", [])
-                if variants:
-                    variant_prices = ", ".join([f"{v['name']}: {v['price']} rupees" for v in variants])
-                    price_info += f". Available sizes: {variant_prices}"
-                
-                # Add allergen info
-                allergens = item.get("allergens", [])
-                allergen_info = ""
-                if allergens:
-                    allergen_info = f" Contains: {', '.join(allergens)}."
-                
-                return f"{item['name']}: {desc}. {price_info}.{allergen_info}"
+        return None  # Let LLM handle
+    
+    def _handle_clear(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Clear the whole order"""
+        order.clear()
+        return "I've cleared your entire order. Would you like to start fresh?"
+    
+    def _handle_remove(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Remove the mentioned dishes from the order"""
+        text_low = norm.lower
+        matches = self.entity_service.find_all_dish_matches(text_low)
+        if matches:
+            qty = self.entity_service.extract_quantity(text_low, default=None)
+            removed = []
+            for _, item, _ in matches:
+                order.remove_item(item["name"], qty)
+                removed.append(item["name"])
+
+            if order.is_empty():
+                return f"I removed {', '.join(removed)}. Your order is now empty."
             else:
-                return "I don't have information about that dish. Could you ask for something from our menu?"
-        
-        # 12. HOW TO MAKE queries - CRITICAL TO CATCH THESE
-        if any(k in text_low for k in ["how to make", "how do you make", "how is it made", "how it's made", "recipe"]):
-            _, item, score = self.entity_service.best_dish_match(text)
-            if item and score >= 0.7:
-                return "I can tell you we have " + item["name"] + " on our menu, but I don't have the recipe details."
+                return f"I removed {', '.join(removed)}. {order.describe_order()}"
+        return "I couldn't find that item in your order."
+    
+    def _handle_update(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Change the quantity of a dish already in the order"""
+        text_low = norm.lower
+        qty = self.entity_service.extract_quantity(text_low)
+        matches = self.entity_service.find_all_dish_matches(text_low)
+        if matches:
+            _, item, _ = matches[0]
+            if order.update_quantity(item["name"], qty):
+                return f"Updated {item['name']} to {qty}. {order.describe_order()}"
             else:
-                return "Sorry, we don't have that item on our menu. Would you like to know about something we do have?"
-        
-        # 13. Vegetarian / veg options queries
-        if any(k in text_low for k in ["veg option", "vegetable option", "vegetarian option", "veg options", "vegetable options"]):
-            veg_keywords = ["paneer", "veg", "dal", "aloo", "mushroom", "gobi", "sabzi"]
-            veg_items = []
+                return f"{item['name']} is not in your order yet. Would you like to add it?"
+        return None
+    
+    def _handle_add(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Add one or more dishes (with quantity, variant and addons) to the order"""
+        text_low = norm.lower
+        # Detect if multiple dishes mentioned
+        dish_phrases = self.entity_service.detect_multiple_dishes(text_low)
 
-            for _, item in self.menu_repo.all_menu_items():
-                name_low = item["name"].lower()
-                if any(kw in name_low for kw in veg_keywords):
-                    veg_items.append(item["name"])
+        added_names = []
+        total_qty = 0
 
-            if veg_items:
-                limited = veg_items[:5]
-                return "Some vegetarian options are: " + ", ".join(limited) + "."
+        for dish_phrase in dish_phrases:
+            # Extract quantity for this specific dish phrase
+            qty = self.entity_service.extract_quantity(dish_phrase, default=1)
 
-            return "We have vegetarian options. You can ask for Paneer dishes, Dal Makhani, or Veg Biryani."
-        
-        # 14. QUANTITY queries like "On 21 Gulab Jamun" or "21 Gulab Jamun"
-        quantity_match = re.search(r'\b(\d+)\s+([a-z\s]+)\b', text_low)
+            # Find matches for this specific dish phrase
+            matches = self.entity_service.find_all_dish_matches(dish_phrase)
+
+            if not matches:
+                # Try without quantity words
+                dish_phrase_clean = _QTY_STRIP_RE.sub('', dish_phrase).strip()
+                matches = self.entity_service.find_all_dish_matches(dish_phrase_clean)
+
+            if matches:
+                # Take only the best match for this phrase
+                best_match = matches[0]
+                _, item, score = best_match
+
+                if score >= 0.7:  # Good match threshold
+                    # Check availability
+                    available, avail_msg = self.policy_service.check_item_availability(item["name"])
+                    if not available:
+                        return avail_msg
+
+                    # Detect variant (e.g., "large", "regular", "boneless");
+                    # dish phrases are already lowercased by detect_multiple_dishes
+                    variant = self._detect_variant(dish_phrase, item)
+
+                    # Detect addons (e.g., "with extra cheese", "with raita")
+                    addons = self._detect_addons(dish_phrase, item)
+
+                    # Get price based on variant
+                    base_price = self._get_item_price(item, variant)
+
+                    # Calculate total price including addons
+                    total_price = base_price
+                    if addons:
+                        addon_prices = {a["name"]: a["price"] for a in item.get("addons", [])}
+                        for addon_name in addons:
+                            if addon_name in addon_prices:
+                                total_price += addon_prices[addon_name]
+
+                    # Get allergens
+                    allergens = item.get("allergens", [])
+
+                    # Add to order with full details
+                    order.add_item(
+                        item["name"], 
+                        total_price, 
+                        qty,
+                        variant=variant,
+                        addons=addons,
+                        allergens=allergens,
+                        item_id=item.get("id")
+                    )
+
+                    # Build description for confirmation
+                    item_desc = item['name']
+                    if variant:
+                        item_desc += f" ({variant})"
+                    if addons:
+                        item_desc += f" with {', '.join(addons)}"
+                    added_names.append(f"{qty} {item_desc}")
+                    total_qty += qty
+
+        if not added_names:
+            return self.unavailable_item_fallback()
+
+        added_str = ", ".join(added_names)
+        return f"Great! I've added {added_str}. {order.describe_order()}"
+    
+    def _handle_summary(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Order summary / total"""
+        return order.describe_order()
+    
+    def _handle_restaurant_name(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Restaurant name"""
+        rest = self.menu_repo.get_restaurant_info()
+        if rest:
+            return f"Our restaurant name is {rest.get('name', 'Infocall Dine')}."
+        return None
+    
+    def _handle_address(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Restaurant address / location"""
+        rest = self.menu_repo.get_restaurant_info()
+        if rest:
+            return f"We are located at {rest.get('address', 'MG Road, Mumbai')}."
+        return None
+    
+    def _handle_phone(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Restaurant phone / contact"""
+        rest = self.menu_repo.get_restaurant_info()
+        if rest:
+            return f"You can reach us at {rest.get('phone', '+91 98765 43210')}."
+        return None
+    
+    def _handle_menu(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Menu queries, category-specific when a category is named"""
+        text_low = norm.lower
+        # Category-specific handling
+        for cat_name, reply in self._category_replies():
+            if cat_name in text_low:
+                return reply
+
+        suggestions = self.menu_suggestion_string(limit_per_category=2)
+        return "Here's our menu: " + suggestions
+    
+    def _handle_price(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Price of the mentioned dishes"""
+        text_low = norm.lower
+        matches = self.entity_service.find_all_dish_matches(text_low)
+        if matches:
+            prices = []
+            for _, item, score in matches:
+                if score >= 0.7:
+                    prices.append(f"{item['name']} costs {item['price']} rupees")
+            if prices:
+                return " | ".join(prices)
+        return "I'm not sure which dish you're asking about. Could you please say the exact dish name?"
+    
+    def _handle_describe(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Dish description with variants and allergens"""
+        text_low = norm.lower
+        _, item, score = self.entity_service.best_dish_match(text_low)
+        if item and score >= 0.7:
+            desc = item.get("description", "No description available")
+            price_info = f"Price: {item['price']} rupees"
+
+            # Add variant info if available
+            variants = item.get("variants", [])
+            if variants:
+                variant_prices = ", ".join([f"{v['name']}: {v['price']} rupees" for v in variants])
+                price_info += f". Available sizes: {variant_prices}"
+
+            # Add allergen info
+            allergens = item.get("allergens", [])
+            allergen_info = ""
+            if allergens:
+                allergen_info = f" Contains: {', '.join(allergens)}."
+
+            return f"{item['name']}: {desc}. {price_info}.{allergen_info}"
+        else:
+            return "I don't have information about that dish. Could you ask for something from our menu?"
+    
+    def _handle_recipe(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """'How to make' queries"""
+        text_low = norm.lower
+        _, item, score = self.entity_service.best_dish_match(text_low)
+        if item and score >= 0.7:
+            return "I can tell you we have " + item["name"] + " on our menu, but I don't have the recipe details."
+        else:
+            return "Sorry, we don't have that item on our menu. Would you like to know about something we do have?"
+    
+    def _handle_veg(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Vegetarian options"""
+        veg_items = self._veg_item_names()
+
+        if veg_items:
+            limited = veg_items[:5]
+            return "Some vegetarian options are: " + ", ".join(limited) + "."
+
+        return "We have vegetarian options. You can ask for Paneer dishes, Dal Makhani, or Veg Biryani."
+    
+    def _handle_quantity_phrase(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Quantity phrases like '21 Gulab Jamun'"""
+        text_low = norm.lower
+        quantity_match = _QTY_ITEM_RE.search(text_low)
         if quantity_match:
             qty = int(quantity_match.group(1))
             item_text = quantity_match.group(2).strip()
-            
+
             _, item, score = self.entity_service.best_dish_match(item_text)
             if item and score >= 0.7:
                 order.add_item(item["name"], item["price"], qty)
                 return f"Added {qty} {item['name']} to your order. {order.describe_order()}"
-        
-        # 15. If user just says a dish name without context
-        words = text_low.split()
-        if len(words) <= 3:  # Short queries like "Gulab Jamun", "butter chicken"
-            _, item, score = self.entity_service.best_dish_match(text)
+        return None
+    
+    def _handle_dish_name(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """A bare dish name without context"""
+        text_low = norm.lower
+        if len(norm.words) <= 3:  # Short queries like "Gulab Jamun", "butter chicken"
+            _, item, score = self.entity_service.best_dish_match(text_low)
             if item and score >= 0.7:
                 current_qty = order.get_item_quantity(item["name"])
                 if current_qty > 0:
                     return f"You have {current_qty} {item['name']} in your order. Would you like to add more?"
                 else:
                     return f"Yes, we have {item['name']} for {item['price']} rupees. Would you like to order it?"
-        
-        # 16. Beverage queries
-        if any(k in text_low for k in ["drink", "beverage", "coffee", "tea", "soda", "cold drink"]):
-            _, item, score = self.entity_service.best_dish_match(text)
-            if item and score >= 0.7:
-                return f"Yes, we have {item['name']} for {item['price']} rupees."
-        
-        # 17. Allergen queries
-        if any(k in text_low for k in ["allergen", "allergy", "contains", "dairy", "nuts", "gluten"]):
-            _, item, score = self.entity_service.best_dish_match(text)
-            if item and score >= 0.7:
-                allergens = item.get("allergens", [])
-                if allergens:
-                    return f"{item['name']} contains: {', '.join(allergens)}."
-                else:
-                    return f"{item['name']} has no listed allergens."
+        return None
+    
+    def _handle_beverage(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Beverage availability"""
+        text_low = norm.lower
+        _, item, score = self.entity_service.best_dish_match(text_low)
+        if item and score >= 0.7:
+            return f"Yes, we have {item['name']} for {item['price']} rupees."
+        return None
+    
+    def _handle_allergen(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Allergens of a dish, or of the current order"""
+        text_low = norm.lower
+        _, item, score = self.entity_service.best_dish_match(text_low)
+        if item and score >= 0.7:
+            allergens = item.get("allergens", [])
+            if allergens:
+                return f"{item['name']} contains: {', '.join(allergens)}."
             else:
-                # Check order allergens
-                order_allergens = order.get_allergens_summary()
-                if order_allergens:
-                    return f"Your order contains: {', '.join(order_allergens)}."
-                return "I can check allergens for specific dishes. Which dish would you like to know about?"
-        
-        # 18. Variant queries (e.g., "what sizes are available for butter chicken")
-        if any(k in text_low for k in ["size", "variant", "option", "available size", "what size"]):
-            _, item, score = self.entity_service.best_dish_match(text)
-            if item and score >= 0.7:
-                variants = item.get("variants", [])
-                if variants:
-                    variant_list = ", ".join([f"{v['name']} ({v['price']} rupees)" for v in variants])
-                    return f"{item['name']} is available in: {variant_list}."
-                else:
-                    return f"{item['name']} is available in regular size only."
+                return f"{item['name']} has no listed allergens."
+        else:
+            # Check order allergens
+            order_allergens = order.get_allergens_summary()
+            if order_allergens:
+                return f"Your order contains: {', '.join(order_allergens)}."
+            return "I can check allergens for specific dishes. Which dish would you like to know about?"
+    
+    def _handle_variant(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Available sizes/variants of a dish"""
+        text_low = norm.lower
+        _, item, score = self.entity_service.best_dish_match(text_low)
+        if item and score >= 0.7:
+            variants = item.get("variants", [])
+            if variants:
+                variant_list = ", ".join([f"{v['name']} ({v['price']} rupees)" for v in variants])
+                return f"{item['name']} is available in: {variant_list}."
+            else:
+                return f"{item['name']} is available in regular size only."
+        return None
+    
+    def _handle_addon(self, norm: NormalizedText, order: IOrderManager) -> Optional[str]:
+        """Available addons for a dish"""
+        text_low = norm.lower
+        _, item, score = self.entity_service.best_dish_match(text_low)
+        if item and score >= 0.7:
+            addons = item.get("addons", [])
+            if addons:
+                addon_list = ", ".join([f"{a['name']} (+{a['price']} rupees)" for a in addons])
+                return f"You can add to {item['name']}: {addon_list}."
+            else:
+                return f"{item['name']} doesn't have additional addons available."
+        return None
+    
+    def _item_patterns(self, item: Dict) -> Tuple:
+        """
+        Compiled variant/addon matchers for a menu item, built once per item
+        and menu version.
         
-        # 19. Addon queries (e.g., "what can I add to paneer tikka")
-        if any(k in text_low for k in ["addon", "extra", "can i add", "what can i add", "add to"]):
-            _, item, score = self.entity_service.best_dish_match(text)
-            if item and score >= 0.7:
-                addons = item.get("addons", [])
-                if addons:
-                    addon_list = ", ".join([f"{a['name']} (+{a['price']} rupees)" for a in addons])
-                    return f"You can add to {item['name']}: {addon_list}."
-                else:
-                    return f"{item['name']} doesn't have additional addons available."
+        Returns (variant_re, variant_by_lower, match_addons), where
+        variant_by_lower maps lowercased variant name -> variant dict and
+        match_addons maps text to the indexes of addons mentioned in it; a
+        matcher is None when the item has no variants/addons to match.
+        """
+        version = self.menu_repo.version()
+        if self._item_pattern_cache[0] != version:
+            self._item_pattern_cache = (version, {})
+        by_item = self._item_pattern_cache[1]
+        cached = by_item.get(id(item))
+        if cached is not None and cached[0] is item:
+            return cached[1]
         
-        return None  # Let LLM handle
-    
-    def _detect_variant(self, text: str, item: Dict) -> Optional[str]:
-        """Detect variant from user text (e.g., large, regular, boneless)"""
-        text_low = text.lower()
-        variants = item.get("variants", [])
+        variant_by_lower = {}
+        for v in item.get("variants", []):
+            variant_by_lower.setdefault(v["name"].lower(), v)
+        variant_re = None
+        if variant_by_lower:
+            alternation = "|".join(re.escape(n) for n in sorted(variant_by_lower, key=len, reverse=True))
+            # Whole-name matches; lookarounds instead of \b so names ending in
+            # punctuation, e.g. "Regular (6 pcs)", can still match
+            variant_re = re.compile(r"(?<!\w)(" + alternation + r")(?!\w)")
         
-        for variant in variants:
-            variant_name_low = variant["name"].lower()
-            if variant_name_low in text_low:
-                return variant["name"]
+        # Addon words match anywhere in the text ("olives" mentions "Olive")
+        addon_words = {
+            idx: [word for word in addon["name"].lower().split() if len(word) > 2]  # Ignore short words
+            for idx, addon in enumerate(item.get("addons", []))
+        }
+        match_addons = None
+        if any(addon_words.values()):
+            match_addons = build_keyword_matcher(addon_words)
         
-        return None
+        patterns = (variant_re, variant_by_lower, match_addons)
+        by_item[id(item)] = (item, patterns)  # Keep item alive so id() stays unique
+        return patterns
     
-    def _detect_addons(self, text: str, item: Dict) -> Optional[List[str]]:
-        """Detect addons from user text (e.g., with extra cheese, with raita)"""
-        text_low = text.lower()
-        addons = item.get("addons", [])
-        detected = []
-        
+    def _detect_variant(self, text_low: str, item: Dict) -> Optional[str]:
+        """Detect variant from lowercased user text (e.g., large, regular, boneless)"""
+        variant_re, variant_by_lower, _ = self._item_patterns(item)
+        if variant_re is None:
+            return None
+        m = variant_re.search(text_low)
+        return variant_by_lower[m.group(1)]["name"] if m else None
+    
+    def _detect_addons(self, text_low: str, item: Dict) -> Optional[List[str]]:
+        """Detect addons from lowercased user text (e.g., with extra cheese, with raita)"""
         # Common patterns
-        if "with" in text_low or "add" in text_low or "extra" in text_low:
-            for addon in addons:
-                addon_name_low = addon["name"].lower()
-                # Check if addon name appears in text
-                addon_words = addon_name_low.split()
-                if any(word in text_low for word in addon_words if len(word) > 2):  # Ignore short words
-                    detected.append(addon["name"])
+        if "with" not in text_low and "add" not in text_low and "extra" not in text_low:
+            return None
+        
+        match_addons = self._item_patterns(item)[2]
+        if match_addons is None:
+            return None
         
-        return detected if detected else None
+        hit = match_addons(text_low)
+        if not hit:
+            return None
+        addons = item["addons"]
+        return [addons[i]["name"] for i in sorted(hit)]
     
     def _get_item_price(self, item: Dict, variant: Optional[str] = None) -> float:
         """Get item price based on variant"""
         if variant:
-            variants = item.get("variants", [])
-            for v in variants:
-                if v["name"].lower() == variant.lower():
-                    return float(v["price"])
+            v = self._item_patterns(item)[1].get(variant.lower())
+            if v is not None:
+                return float(v["price"])
         
         # Return base price
         return float(item.get("price", 0))
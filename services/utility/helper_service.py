@@ -10,13 +10,45 @@ Utility functions for common operations:
 This service provides shared utility functions used across the application.
 """
 
-import uuid
 import json
+import os
+import secrets
 import time
 from datetime import datetime
-from typing import Any, Optional, Dict
+from typing import Any, Callable, Optional, Dict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# _json_dumps raises TypeError on unsupported types unless a default hook is given
+if orjson is not None:
+    # Datetimes/dataclasses are left to the default hook (or rejected) like with stdlib json
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def _json_dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+        opts = _ORJSON_OPTS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTS
+        return orjson.dumps(obj, default=default, option=opts).decode()
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+        if indent:
+            return json.dumps(obj, indent=2, default=default)
+        return json.dumps(obj, separators=(',', ':'), default=default)
+
+    _json_loads = json.loads
+
+# (epoch second, ISO text for that second) memo for get_timestamp
+_ts_cache = (-1, "")
+
+# Response templates; copy() yields a dict already sized for these keys
+# (the timestamp key is added per call: 'timestamp' or 'timestamp_ns')
+_ERROR_TEMPLATE = {'error': True, 'error_code': None, 'message': None}
+_SUCCESS_TEMPLATE = {'success': True, 'data': None}
+
 
 class HelperService:
     """
@@ -36,10 +68,10 @@ class HelperService:
         Returns:
             Unique identifier string
         """
-        unique_id = str(uuid.uuid4()).replace('-', '')[:12]
+        unique_id = secrets.token_hex(6).upper()  # 12 hex chars, no UUID formatting
         if prefix:
-            return f"{prefix}{unique_id.upper()}"
-        return unique_id.upper()
+            return f"{prefix}{unique_id}"
+        return unique_id
     
     @staticmethod
     def generate_call_id() -> str:
@@ -56,10 +88,33 @@ class HelperService:
         """
         Get current timestamp in ISO format
         
+        The date/time part is formatted once per second; only the
+        microseconds are appended per call.
+        
         Returns:
             ISO formatted timestamp string
         """
-        return datetime.now().isoformat()
+        global _ts_cache
+        now = time.time()
+        sec = int(now)
+        cached_sec, prefix = _ts_cache
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec).isoformat()
+            _ts_cache = (sec, prefix)
+        usec = int((now - sec) * 1_000_000)
+        return f"{prefix}.{usec:06d}" if usec else prefix
+    
+    @staticmethod
+    def get_timestamp_ns() -> int:
+        """
+        Get a monotonic timestamp in nanoseconds
+        
+        Only meaningful for ordering and differences within this process.
+        
+        Returns:
+            time.perf_counter_ns() value
+        """
+        return time.perf_counter_ns()
     
     @staticmethod
     def get_timestamp_unix() -> float:
@@ -111,7 +166,7 @@ class HelperService:
             Parsed JSON object or default value
         """
         try:
-            return json.loads(json_str)
+            return _json_loads(json_str)
         except (json.JSONDecodeError, TypeError):
             return default
     
@@ -128,7 +183,7 @@ class HelperService:
             JSON string or default value
         """
         try:
-            return json.dumps(obj, default=str)
+            return _json_dumps(obj, default=str)
         except (TypeError, ValueError):
             return default
     
@@ -148,35 +203,52 @@ class HelperService:
             default = {}
         
         try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return default
+            # A missing file raises here, so no separate exists() check
+            with open(file_path, 'rb') as f:
+                return _json_loads(f.read())
         except (json.JSONDecodeError, IOError):
             return default
     
     @staticmethod
-    def save_json_file(file_path: Path, data: Dict) -> bool:
+    def save_json_file(file_path: Path, data: Dict, pretty: bool = False, strict: bool = False) -> bool:
         """
         Save dictionary to JSON file
         
+        Writes to a temporary sibling file and renames it over the target,
+        so readers never see a partially written file.
+        
         Args:
             file_path: Path to save JSON file
             data: Dictionary to save
+            pretty: Indent the output (default: compact)
+            strict: Fail the save on values JSON cannot represent instead of
+                writing them as their str() (e.g. datetime, Path, Decimal)
             
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
         try:
+            payload = _json_dumps(data, indent=pretty, default=None if strict else str)
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
             return True
-        except (IOError, TypeError):
+        except (IOError, TypeError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             return False
     
     @staticmethod
-    def create_error_response(message: str, error_code: str = "ERROR", details: Optional[Dict] = None) -> Dict:
+    def create_error_response(
+        message: str,
+        error_code: str = "ERROR",
+        details: Optional[Dict] = None,
+        use_ns: bool = False
+    ) -> Dict:
         """
         Create standardized error response dictionary
         
@@ -184,16 +256,19 @@ class HelperService:
             message: Error message
             error_code: Error code string
             details: Optional additional error details
+            use_ns: Add a monotonic 'timestamp_ns' (internal use) instead
+                of the ISO 'timestamp'
             
         Returns:
             Error response dictionary
         """
-        response = {
-            'error': True,
-            'error_code': error_code,
-            'message': message,
-            'timestamp': HelperService.get_timestamp()
-        }
+        response = _ERROR_TEMPLATE.copy()
+        response['error_code'] = error_code
+        response['message'] = message
+        if use_ns:
+            response['timestamp_ns'] = time.perf_counter_ns()
+        else:
+            response['timestamp'] = HelperService.get_timestamp()
         
         if details:
             response['details'] = details
@@ -201,22 +276,25 @@ class HelperService:
         return response
     
     @staticmethod
-    def create_success_response(data: Any, message: Optional[str] = None) -> Dict:
+    def create_success_response(data: Any, message: Optional[str] = None, use_ns: bool = False) -> Dict:
         """
         Create standardized success response dictionary
         
         Args:
             data: Response data
             message: Optional success message
+            use_ns: Add a monotonic 'timestamp_ns' (internal use) instead
+                of the ISO 'timestamp'
             
         Returns:
             Success response dictionary
         """
-        response = {
-            'success': True,
-            'data': data,
-            'timestamp': HelperService.get_timestamp()
-        }
+        response = _SUCCESS_TEMPLATE.copy()
+        response['data'] = data
+        if use_ns:
+            response['timestamp_ns'] = time.perf_counter_ns()
+        else:
+            response['timestamp'] = HelperService.get_timestamp()
         
         if message:
             response['message'] = message
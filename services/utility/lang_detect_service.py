@@ -12,10 +12,61 @@ This service:
 """
 
 from typing import Optional, Dict
+import functools
 import re
 
+from core.keyword_matcher import build_keyword_matcher
 from global_data import LANGUAGES, DEFAULT_LANGUAGE
 
+# Language-specific keywords; table order is also the tie-break order
+_LANGUAGE_KEYWORDS = (
+    ('en', ('hello', 'hi', 'yes', 'no', 'please', 'thank', 'order', 'menu')),
+    ('hi', ('नमस्ते', 'हैं', 'क्या', 'में', 'के', 'है')),
+    ('gu', ('નમસ્તે', 'છે', 'કેવી', 'માં', 'ના')),
+    ('mr', ('नमस्कार', 'आहे', 'काय', 'मध्ये', 'चा')),
+)
+# Fixed score slot per language (only these can score above zero)
+_LANGS = tuple(lang for lang, _ in _LANGUAGE_KEYWORDS)
+_HI, _GU, _MR = (_LANGS.index(lang) for lang in ('hi', 'gu', 'mr'))
+_KEYWORD_SLOT = {kw: i for i, (_, keywords) in enumerate(_LANGUAGE_KEYWORDS) for kw in keywords}
+# Returns the distinct keywords occurring in the text (each keyword is its own
+# group, so overlaps like 'है' inside 'हैं' both count). Matching ignores case,
+# so the input never needs a lowercased copy (only the Latin keywords are cased).
+_match_keywords = build_keyword_matcher({kw: (kw,) for kw in _KEYWORD_SLOT}, re.IGNORECASE)
+
+_DEVANAGARI_RE = re.compile(r'[\u0900-\u097F]')  # Hindi, Marathi
+_GUJARATI_RE = re.compile(r'[\u0A80-\u0AFF]')
+
+# Detection looks at this many leading characters; successive partial
+# transcripts share their prefix and so hit the cache
+DETECT_PREFIX_CHARS = 64
+DETECT_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=DETECT_CACHE_SIZE)
+def _detect_cached(text: str) -> str:
+    """Score keywords and scripts in text and return the best language code"""
+    # Check for language-specific keywords (each distinct keyword counts once)
+    scores = [0] * len(_LANGS)
+    for keyword in _match_keywords(text):
+        scores[_KEYWORD_SLOT[keyword]] += 1
+
+    # Script checks; str.isascii() only reads the string's header flag,
+    # and pure-ASCII text can contain neither script
+    if not text.isascii():
+        # Check for Devanagari script (Hindi, Marathi)
+        if _DEVANAGARI_RE.search(text):
+            scores[_HI] += 3
+            scores[_MR] += 2
+
+        # Check for Gujarati script
+        if _GUJARATI_RE.search(text):
+            scores[_GU] += 3
+
+    # Return language with highest score, default to English
+    best = max(range(len(scores)), key=scores.__getitem__)
+    return _LANGS[best] if scores[best] > 0 else DEFAULT_LANGUAGE
+
 
 class LanguageDetectionService:
     """
@@ -34,7 +85,8 @@ class LanguageDetectionService:
         Detect language from text input
         
         Uses keyword detection and character analysis to determine
-        the most likely language.
+        the most likely language. Only the first DETECT_PREFIX_CHARS
+        characters are analyzed, and results are memoized by that prefix.
         
         Args:
             text: Input text to analyze
@@ -45,35 +97,12 @@ class LanguageDetectionService:
         if not text or not text.strip():
             return DEFAULT_LANGUAGE
         
-        text_lower = text.lower()
-        
-        # Check for language-specific keywords
-        language_keywords = {
-            'en': ['hello', 'hi', 'yes', 'no', 'please', 'thank', 'order', 'menu'],
-            'hi': ['नमस्ते', 'हैं', 'क्या', 'में', 'के', 'है'],
-            'gu': ['નમસ્તે', 'છે', 'કેવી', 'માં', 'ના'],
-            'mr': ['नमस्कार', 'आहे', 'काय', 'मध्ये', 'चा'],
-        }
-        
-        scores = {lang: 0 for lang in self.supported_languages}
-        
-        for lang, keywords in language_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    scores[lang] += 1
-        
-        # Check for Devanagari script (Hindi, Marathi)
-        if re.search(r'[\u0900-\u097F]', text):
-            scores['hi'] += 3
-            scores['mr'] += 2
-        
-        # Check for Gujarati script
-        if re.search(r'[\u0A80-\u0AFF]', text):
-            scores['gu'] += 3
-        
-        # Return language with highest score, default to English
-        detected = max(scores.items(), key=lambda x: x[1])
-        return detected[0] if detected[1] > 0 else DEFAULT_LANGUAGE
+        return _detect_cached(text[:DETECT_PREFIX_CHARS])
+    
+    @staticmethod
+    def clear_cache():
+        """Drop memoized detections (e.g. after the keyword tables change)"""
+        _detect_cached.cache_clear()
     
     def get_language_entity(self, text: str) -> Dict[str, str]:
         """
@@ -11,8 +11,14 @@ This service:
 - Handles memory persistence and retrieval
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Dict, Optional
+
+from .helper_service import HelperService
+
+# Display labels for the common roles; other roles fall back to str.capitalize()
+_ROLE_CAP = {"user": "User", "assistant": "Assistant", "system": "System"}
 
 
 class MemoryService:
@@ -30,7 +36,12 @@ class MemoryService:
             max_messages: Maximum number of messages to retain per session
         """
         self.max_messages = max_messages
-        self.sessions: Dict[str, List[Dict]] = {}
+        # Bounded per session: appends past max_messages evict the oldest in O(1)
+        self.sessions: Dict[str, Deque[Dict]] = {}
+        # "Role: content" lines kept alongside each session, plus the joined
+        # context string (rebuilt lazily after each new message)
+        self._context_lines: Dict[str, Deque[str]] = {}
+        self._context_str: Dict[str, str] = {}
     
     def add_message(
         self, 
@@ -52,22 +63,24 @@ class MemoryService:
             content: Message content
             metadata: Optional metadata dictionary
         """
-        if call_id not in self.sessions:
-            self.sessions[call_id] = []
-        
         message = {
             'request_id': request_id,
             'role': role,
             'content': content,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': HelperService.get_timestamp(),
             'metadata': metadata or {}
         }
         
-        self.sessions[call_id].append(message)
-        
-        # Trim to max_messages
-        if len(self.sessions[call_id]) > self.max_messages:
-            self.sessions[call_id] = self.sessions[call_id][-self.max_messages:]
+        session = self.sessions.get(call_id)
+        if session is None:
+            session = self.sessions[call_id] = deque(maxlen=self.max_messages)
+        session.append(message)
+
+        lines = self._context_lines.get(call_id)
+        if lines is None:
+            lines = self._context_lines[call_id] = deque(maxlen=self.max_messages)
+        lines.append(f"{_ROLE_CAP.get(role) or role.capitalize()}: {content}")
+        self._context_str.pop(call_id, None)
     
     def get_session_memory(self, call_id: str) -> List[Dict]:
         """
@@ -79,7 +92,7 @@ class MemoryService:
         Returns:
             List of message dictionaries
         """
-        return self.sessions.get(call_id, [])
+        return list(self.sessions.get(call_id, ()))
     
     def get_recent_messages(self, call_id: str, n: int = 5) -> List[Dict]:
         """
@@ -92,8 +105,8 @@ class MemoryService:
         Returns:
             List of recent message dictionaries
         """
-        messages = self.get_session_memory(call_id)
-        return messages[-n:] if len(messages) > n else messages
+        messages = self.sessions.get(call_id, ())
+        return list(islice(messages, max(0, len(messages) - n), None))
     
     def clear_session(self, call_id: str) -> None:
         """
@@ -104,6 +117,8 @@ class MemoryService:
         """
         if call_id in self.sessions:
             del self.sessions[call_id]
+        self._context_lines.pop(call_id, None)
+        self._context_str.pop(call_id, None)
     
     def get_conversation_context(self, call_id: str) -> str:
         """
@@ -115,13 +130,10 @@ class MemoryService:
         Returns:
             Formatted conversation history as string
         """
-        messages = self.get_session_memory(call_id)
-        context_parts = []
-        
-        for msg in messages:
-            role = msg['role'].capitalize()
-            content = msg['content']
-            context_parts.append(f"{role}: {content}")
-        
-        return "\n".join(context_parts)
+        context = self._context_str.get(call_id)
+        if context is None:
+            context = "\n".join(self._context_lines.get(call_id, ()))
+            if call_id in self._context_lines:
+                self._context_str[call_id] = context
+        return context
 
@@ -11,11 +11,19 @@ This service:
 - Provides rate limit checking and enforcement
 """
 
-from typing import Dict, Optional, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
+import time
+from typing import Deque, Dict, Optional, Tuple
+from collections import defaultdict, deque
 
 from global_data import DEFAULT_RATE_LIMIT_PER_MINUTE, DEFAULT_RATE_LIMIT_PER_HOUR
+from .helper_service import HelperService
+
+# Sliding window lengths (seconds, on the monotonic clock)
+MINUTE_WINDOW = 60.0
+HOUR_WINDOW = 3600.0
+# Retention caps for RateLimitRecord entities (oldest records are dropped first)
+MAX_RATE_LIMIT_RECORDS = 10_000
+MAX_RECORDS_PER_IDENTIFIER = 1_000
 
 
 class RateLimiter:
@@ -41,9 +49,16 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         
-        # Track requests: {identifier: [(timestamp, request_id), ...]}
-        self.request_history: Dict[str, list] = defaultdict(list)
-        self.rate_limit_records: list = []
+        # Track requests: {identifier: deque([timestamp, ...])}, oldest first and
+        # pruned from the left to the last hour (request ids live only in records)
+        self.request_history: Dict[str, Deque[float]] = defaultdict(deque)
+        # Timestamps of the last minute only, so both windows are counted with len()
+        self._minute_history: Dict[str, Deque[float]] = defaultdict(deque)
+        self.rate_limit_records: Deque[Dict] = deque(maxlen=MAX_RATE_LIMIT_RECORDS)
+        # Same records indexed by identifier for get_rate_limit_records
+        self._records_by_identifier: Dict[str, Deque[Dict]] = defaultdict(
+            lambda: deque(maxlen=MAX_RECORDS_PER_IDENTIFIER)
+        )
     
     def check_rate_limit(
         self, 
@@ -64,48 +79,50 @@ class RateLimiter:
             - is_allowed: True if request is allowed
             - rate_limit_record: RateLimitRecord dict if limit exceeded, None otherwise
         """
-        now = datetime.now()
+        now = time.monotonic()
         
-        # Clean old entries (older than 1 hour)
-        cutoff = now - timedelta(hours=1)
-        self.request_history[identifier] = [
-            (ts, req_id) for ts, req_id in self.request_history[identifier]
-            if ts > cutoff
-        ]
+        # Clean old entries (older than 1 hour) and add current request
+        recent_hour = self.request_history[identifier]
+        hour_cutoff = now - HOUR_WINDOW
+        while recent_hour and recent_hour[0] <= hour_cutoff:
+            recent_hour.popleft()
+        recent_hour.append(now)
         
-        # Add current request
-        self.request_history[identifier].append((now, request_id))
+        recent_minute = self._minute_history[identifier]
+        minute_cutoff = now - MINUTE_WINDOW
+        while recent_minute and recent_minute[0] <= minute_cutoff:
+            recent_minute.popleft()
+        recent_minute.append(now)
         
         # Check per-minute limit
-        minute_cutoff = now - timedelta(minutes=1)
-        recent_minute = [
-            (ts, req_id) for ts, req_id in self.request_history[identifier]
-            if ts > minute_cutoff
-        ]
-        
         if len(recent_minute) > self.requests_per_minute:
             record = self._create_rate_limit_record(
                 identifier, request_id, 'per_minute', len(recent_minute)
             )
-            self.rate_limit_records.append(record)
+            self._store_record(identifier, record)
             return False, record
         
         # Check per-hour limit
-        hour_cutoff = now - timedelta(hours=1)
-        recent_hour = [
-            (ts, req_id) for ts, req_id in self.request_history[identifier]
-            if ts > hour_cutoff
-        ]
-        
         if len(recent_hour) > self.requests_per_hour:
             record = self._create_rate_limit_record(
                 identifier, request_id, 'per_hour', len(recent_hour)
             )
-            self.rate_limit_records.append(record)
+            self._store_record(identifier, record)
             return False, record
         
         return True, None
     
+    def _store_record(self, identifier: str, record: Dict) -> None:
+        """
+        Keep a RateLimitRecord in the bounded global and per-identifier logs
+        
+        Args:
+            identifier: User/session identifier
+            record: RateLimitRecord dictionary
+        """
+        self.rate_limit_records.append(record)
+        self._records_by_identifier[identifier].append(record)
+    
     def _create_rate_limit_record(
         self, 
         identifier: str, 
@@ -131,7 +148,7 @@ class RateLimiter:
             'limit_type': limit_type,
             'current_count': current_count,
             'limit': self.requests_per_minute if limit_type == 'per_minute' else self.requests_per_hour,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': HelperService.get_timestamp(),
             'action': 'blocked'
         }
     
@@ -146,9 +163,6 @@ class RateLimiter:
             List of RateLimitRecord dictionaries
         """
         if identifier:
-            return [
-                record for record in self.rate_limit_records
-                if record.get('identifier') == identifier
-            ]
-        return self.rate_limit_records
+            return list(self._records_by_identifier.get(identifier, ()))
+        return list(self.rate_limit_records)
 
@@ -1,10 +1,105 @@
-import os
+import asyncio
+import mmap
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
+
+# Voice reference limits: larger/longer files are trimmed to 5 seconds
+MAX_REFERENCE_BYTES = 500 * 1024
+MAX_REFERENCE_SECONDS = 10
+
+# Trimmed reference format: 16 kHz mono 16-bit PCM
+TRIM_SAMPLE_RATE = 16000
+TRIM_BYTES_PER_SEC = TRIM_SAMPLE_RATE * 2
+
 
 # ========== AUDIO TRIMMING FUNCTIONS ==========
+def _trim_cmd(input_path, output):
+    """ffmpeg command that trims to the first 5 seconds (1.5x speed, 16 kHz mono PCM)"""
+    return [
+        'ffmpeg',
+        '-hide_banner', '-loglevel', 'error',  # Only errors on stderr
+        '-y',  # Overwrite output file without asking
+        '-i', input_path,
+        '-t', '5',  # Take only first 5 seconds
+        '-filter:a', 'atempo=1.5',  # Speed up by 1.5x
+        '-ar', str(TRIM_SAMPLE_RATE),  # Sample rate 16000 Hz
+        '-ac', '1',  # Mono channel
+        '-acodec', 'pcm_s16le',  # Audio codec
+        '-map_metadata', '-1',  # Remove metadata
+        '-f', 'wav',
+        output
+    ]
+
+
+def _duration_cmd(input_path):
+    """ffprobe command that prints the container duration in seconds"""
+    return [
+        'ffprobe',
+        '-hide_banner',
+        '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        input_path
+    ]
+
+
+def _print_ffmpeg_missing():
+    print("  ✗ Error: ffmpeg not found. Please install ffmpeg.")
+    print("    On Ubuntu/Debian: sudo apt-get install ffmpeg")
+    print("    On macOS: brew install ffmpeg")
+    print("    On Windows: Download from https://ffmpeg.org/download.html")
+
+
+def fix_wav_sizes(buf: bytearray) -> bytearray:
+    """
+    Fill in the RIFF and data chunk sizes of a WAV written to a pipe
+    
+    ffmpeg cannot seek back on non-seekable output, so it leaves
+    placeholder sizes in the header.
+    """
+    if len(buf) < 12 or buf[:4] != b'RIFF' or buf[8:12] != b'WAVE':
+        return buf
+    buf[4:8] = (len(buf) - 8).to_bytes(4, 'little')
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id = bytes(buf[pos:pos + 4])
+        if chunk_id == b'data':
+            buf[pos + 4:pos + 8] = (len(buf) - pos - 8).to_bytes(4, 'little')
+            break
+        size = int.from_bytes(buf[pos + 4:pos + 8], 'little')
+        pos += 8 + size + (size & 1)
+    return buf
+
+
+def trim_to_5_seconds_bytes(input_path) -> Optional[bytes]:
+    """
+    Trim any audio file to first 5 seconds, returning the WAV bytes
+    
+    ffmpeg writes to stdout, so no temporary file is created or read back.
+    
+    Args:
+        input_path: Path to input audio file
+        
+    Returns:
+        Trimmed WAV bytes, or None on failure
+    """
+    try:
+        print(f"  ↳ Trimming voice reference to 5 seconds with 1.5x speed......")
+        result = subprocess.run(_trim_cmd(input_path, 'pipe:1'), capture_output=True)
+        
+        if result.returncode == 0 and result.stdout:
+            return bytes(fix_wav_sizes(bytearray(result.stdout)))
+        print(f"  ✗ FFmpeg error: {result.stderr.decode('utf-8', 'replace')}")
+        return None
+    except FileNotFoundError:
+        _print_ffmpeg_missing()
+        return None
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return None
+
+
 def trim_to_5_seconds(input_path, output_path):
     """
     Trim any audio file to first 5 seconds
@@ -15,119 +110,223 @@ def trim_to_5_seconds(input_path, output_path):
     """
     try:
         # Construct ffmpeg command to TRIM (not compress)
-        cmd = [
-            'ffmpeg',
-            '-y',  # Overwrite output file without asking
-            '-i', input_path,
-            '-t', '5',  # Take only first 5 seconds
-            '-filter:a', 'atempo=1.5',  # Speed up by 1.5x
-            '-ar', '16000',  # Sample rate 16000 Hz
-            '-ac', '1',  # Mono channel
-            '-acodec', 'pcm_s16le',  # Audio codec
-            '-map_metadata', '-1',  # Remove metadata
-            output_path
-        ]
+        cmd = _trim_cmd(input_path, output_path)
         
         print(f"  ↳ Trimming voice reference to 5 seconds with 1.5x speed......")
         
         # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True)
         
         if result.returncode == 0:
             print(f"  ✓ Voice reference trimmed: {output_path}")
             return True
         else:
-            print(f"  ✗ FFmpeg error: {result.stderr}")
+            print(f"  ✗ FFmpeg error: {result.stderr.decode('utf-8', 'replace')}")
             return False
             
     except FileNotFoundError:
-        print("  ✗ Error: ffmpeg not found. Please install ffmpeg.")
-        print("    On Ubuntu/Debian: sudo apt-get install ffmpeg")
-        print("    On macOS: brew install ffmpeg")
-        print("    On Windows: Download from https://ffmpeg.org/download.html")
+        _print_ffmpeg_missing()
+        return False
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+async def trim_to_5_seconds_async(input_path, output_path):
+    """
+    Trim any audio file to first 5 seconds without blocking the event loop
+    
+    Same output as trim_to_5_seconds; several calls can run concurrently
+    (e.g. with asyncio.gather), one ffmpeg process each.
+    
+    Args:
+        input_path: Path to input audio file
+        output_path: Path to output audio file (first 5 seconds)
+    """
+    try:
+        print(f"  ↳ Trimming voice reference to 5 seconds with 1.5x speed......")
+        proc = await asyncio.create_subprocess_exec(
+            *_trim_cmd(input_path, output_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        
+        if proc.returncode == 0:
+            print(f"  ✓ Voice reference trimmed: {output_path}")
+            return True
+        print(f"  ✗ FFmpeg error: {stderr.decode('utf-8', 'replace')}")
+        return False
+    except FileNotFoundError:
+        _print_ffmpeg_missing()
         return False
     except Exception as e:
         print(f"  ✗ Error: {e}")
         return False
 
+async def trim_to_5_seconds_bytes_async(input_path) -> Optional[bytes]:
+    """
+    Trim any audio file to first 5 seconds without blocking the event loop,
+    returning the WAV bytes captured from ffmpeg's stdout
+    
+    Args:
+        input_path: Path to input audio file
+        
+    Returns:
+        Trimmed WAV bytes, or None on failure
+    """
+    try:
+        print(f"  ↳ Trimming voice reference to 5 seconds with 1.5x speed......")
+        proc = await asyncio.create_subprocess_exec(
+            *_trim_cmd(input_path, 'pipe:1'),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        
+        if proc.returncode == 0 and stdout:
+            return bytes(fix_wav_sizes(bytearray(stdout)))
+        print(f"  ✗ FFmpeg error: {stderr.decode('utf-8', 'replace')}")
+        return None
+    except FileNotFoundError:
+        _print_ffmpeg_missing()
+        return None
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return None
+
+async def get_audio_duration_async(input_path):
+    """
+    Get duration of audio file using ffprobe, without blocking the event loop
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_duration_cmd(input_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode == 0:
+            return float(stdout)
+        return None
+    except Exception:
+        return None
+
 def get_audio_duration(input_path):
     """
     Get duration of audio file using ffprobe
     """
     try:
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            input_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(_duration_cmd(input_path), capture_output=True)
         if result.returncode == 0:
-            return float(result.stdout.strip())
+            return float(result.stdout)  # float() accepts bytes and surrounding whitespace
         return None
     except:
         return None
 
+def _map_file(input_path) -> Union[bytes, memoryview]:
+    """
+    Read-only view of a file's contents via mmap (no copy into the Python heap)
+    
+    The mapping stays valid after the file is closed and is released with
+    the last reference to the view. Empty files fall back to b"".
+    """
+    with open(input_path, 'rb') as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:  # Cannot map an empty file
+            return b""
+
+
 def process_audio_file_for_voice_reference(input_path):
     """
     Process audio file for voice reference: if >500KB or >10s, trim to 5 seconds
-    Returns: (processed_audio_bytes, trimmed_flag)
+    Returns: (processed_audio_bytes, trimmed_flag); an untrimmed file comes
+    back as a read-only memoryview over an mmap of the original file
     """
     try:
         # Check file size
         file_size_bytes = Path(input_path).stat().st_size
         file_size_kb = file_size_bytes / 1024
         
-        # Get audio duration
-        duration = get_audio_duration(input_path)
-        duration_sec = duration if duration else 0
-        
-        print(f"  ↳ Voice reference file: {file_size_kb:.1f}KB, {duration_sec:.1f}s")
-        
-        # Check if trimming is needed
-        needs_trimming = file_size_bytes > (500 * 1024) or (duration and duration > 10)
+        # Check if trimming is needed; size alone decides for large files,
+        # so ffprobe only runs when the duration can change the outcome
+        if file_size_bytes > MAX_REFERENCE_BYTES:
+            print(f"  ↳ Voice reference file: {file_size_kb:.1f}KB")
+            needs_trimming = True
+            reason = f"size: {file_size_kb:.1f}KB"
+        else:
+            duration = get_audio_duration(input_path)
+            duration_sec = duration if duration else 0
+            print(f"  ↳ Voice reference file: {file_size_kb:.1f}KB, {duration_sec:.1f}s")
+            needs_trimming = bool(duration and duration > MAX_REFERENCE_SECONDS)
+            reason = f"size: {file_size_kb:.1f}KB, duration: {duration_sec:.1f}s"
         
         if needs_trimming:
-            print(f"  ⚠️  Voice reference needs trimming (size: {file_size_kb:.1f}KB, duration: {duration_sec:.1f}s)")
-            
-            # Create a temporary file for trimmed audio
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                temp_output = tmp_file.name
+            print(f"  ⚠️  Voice reference needs trimming ({reason})")
             
-            # Trim to 5 seconds
-            success = trim_to_5_seconds(input_path, temp_output)
+            # Trim to 5 seconds, captured straight from ffmpeg's stdout
+            audio_bytes = trim_to_5_seconds_bytes(input_path)
             
-            if success:
-                # Read trimmed audio
-                with open(temp_output, 'rb') as f:
-                    audio_bytes = f.read()
-                
-                # Clean up temp file
-                try:
-                    os.unlink(temp_output)
-                except:
-                    pass
-                
-                # Verify trimmed size
+            if audio_bytes:
+                # Verify trimmed size (duration follows from the fixed PCM format)
                 trimmed_kb = len(audio_bytes) / 1024
-                trimmed_duration = get_audio_duration(temp_output) if os.path.exists(temp_output) else 0
+                trimmed_duration = len(audio_bytes) / TRIM_BYTES_PER_SEC
                 
                 print(f"  ✓ Trimmed to: {trimmed_kb:.1f}KB, {trimmed_duration:.1f}s")
                 return audio_bytes, True
             else:
                 # If trimming fails, use original (with warning)
                 print(f"  ⚠️  Trimming failed, using original file (may cause issues)")
-                with open(input_path, 'rb') as f:
-                    return f.read(), False
+                return _map_file(input_path), False
         else:
             # File is within limits, use as-is
             print(f"  ✓ Voice reference within limits, using as-is")
-            with open(input_path, 'rb') as f:
-                return f.read(), False
+            return _map_file(input_path), False
                 
     except Exception as e:
         print(f"  ✗ Error processing voice reference: {e}")
         return None, False
 
+
+async def process_audio_file_for_voice_reference_async(input_path):
+    """
+    Async counterpart of process_audio_file_for_voice_reference: ffprobe and
+    ffmpeg run as asyncio subprocesses, so the event loop (and other startup
+    work gathered alongside) keeps running while they do
+    Returns: (processed_audio_bytes, trimmed_flag)
+    """
+    try:
+        file_size_bytes = Path(input_path).stat().st_size
+        file_size_kb = file_size_bytes / 1024
+        
+        # Size alone decides for large files; ffprobe only when the duration matters
+        if file_size_bytes > MAX_REFERENCE_BYTES:
+            print(f"  ↳ Voice reference file: {file_size_kb:.1f}KB")
+            needs_trimming = True
+            reason = f"size: {file_size_kb:.1f}KB"
+        else:
+            duration = await get_audio_duration_async(input_path)
+            duration_sec = duration if duration else 0
+            print(f"  ↳ Voice reference file: {file_size_kb:.1f}KB, {duration_sec:.1f}s")
+            needs_trimming = bool(duration and duration > MAX_REFERENCE_SECONDS)
+            reason = f"size: {file_size_kb:.1f}KB, duration: {duration_sec:.1f}s"
+        
+        if not needs_trimming:
+            print(f"  ✓ Voice reference within limits, using as-is")
+            return _map_file(input_path), False
+        
+        print(f"  ⚠️  Voice reference needs trimming ({reason})")
+        audio_bytes = await trim_to_5_seconds_bytes_async(input_path)
+        if not audio_bytes:
+            print(f"  ⚠️  Trimming failed, using original file (may cause issues)")
+            return _map_file(input_path), False
+        
+        # No second ffprobe: the duration follows from the fixed PCM format
+        trimmed_kb = len(audio_bytes) / 1024
+        trimmed_duration = len(audio_bytes) / TRIM_BYTES_PER_SEC
+        print(f"  ✓ Trimmed to: {trimmed_kb:.1f}KB, {trimmed_duration:.1f}s")
+        return audio_bytes, True
+    
+    except Exception as e:
+        print(f"  ✗ Error processing voice reference: {e}")
+        return None, False
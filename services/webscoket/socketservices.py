@@ -1,11 +1,35 @@
 import asyncio
+import importlib
 import websockets
+from websockets.extensions import permessage_deflate
 import json
 import logging
 import os
 from dotenv import load_dotenv
-import time
+import random
+import secrets
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    # websocket-client; optional, only for SyncSocketService. The name can
+    # also resolve to an unrelated "websocket" package on sys.path, so check
+    # for the client API rather than trusting the import.
+    _ws_client = importlib.import_module("websocket")
+    if not hasattr(_ws_client, "create_connection"):
+        _ws_client = None
+except ImportError:
+    _ws_client = None
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    _dumps = json.dumps
+    _loads = json.loads
 
 # Set up basic logging for better traceability
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +38,222 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env if present
 load_dotenv()
 
+# Seconds a multiplexed request waits for its correlated response
+MUX_RESPONSE_TIMEOUT = 60.0
+# Upper bound on requests coalesced into one batched frame
+MUX_MAX_BATCH = 64
+# Backpressure: concurrent requests per multiplexed connection, how long a new
+# request waits for a free slot, and the size of the batching writer's queue
+MUX_MAX_INFLIGHT = 64
+MUX_ADMIT_TIMEOUT = 10.0
+MUX_OUTBOX_SIZE = 256
+
+# permessage-deflate is off by default: requests are small and TTS responses are
+# base64 audio, which barely compresses. Set WS_COMPRESSION=1 for text-heavy
+# (e.g. long LLM) traffic over slow links.
+WS_COMPRESSION = os.getenv("WS_COMPRESSION", "").lower() in ("1", "true", "yes")
+
+# Retry policy for _send_request: capped exponential backoff with jitter
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_JITTER = 0.5  # up to +50% random stretch per delay
+# Errors worth retrying (network, protocol, timeouts); anything else is raised at once
+_TRANSIENT_ERRORS = (websockets.WebSocketException, OSError, asyncio.TimeoutError)
+
+
+class RateLimitedError(Exception):
+    """A multiplexed connection is at capacity; the request was not sent."""
+
+
+class _MuxConnection:
+    """
+    One WebSocket carrying many in-flight requests at once.
+    Each request carries a unique "request_id" that the server echoes back;
+    a background reader task resolves the matching future, so concurrent
+    requests overlap instead of waiting for each other's responses.
+    With a batch window, requests queued within that window are sent
+    together as one JSON-array frame by a writer task.
+    """
+
+    def __init__(self, ws, batch_window: float = 0.0):
+        self.ws = ws
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.batch_window = batch_window
+        self.inflight = asyncio.Semaphore(MUX_MAX_INFLIGHT)
+        self.outbox: Optional[asyncio.Queue] = None
+        self.writer: Optional[asyncio.Task] = None
+        if batch_window > 0:
+            self.outbox = asyncio.Queue(maxsize=MUX_OUTBOX_SIZE)
+            self.writer = asyncio.create_task(self._write_loop())
+        self.reader = asyncio.create_task(self._read_loop())
+
+    @property
+    def alive(self) -> bool:
+        return not self.reader.done() and (self.writer is None or not self.writer.done())
+
+    def _fail_pending(self, error: BaseException):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+
+    async def _write_loop(self):
+        """Coalesce requests arriving within batch_window into one frame."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch = [await self.outbox.get()]
+                deadline = loop.time() + self.batch_window
+                while len(batch) < MUX_MAX_BATCH:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.outbox.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                await self.ws.send(batch[0] if len(batch) == 1 else "[" + ",".join(batch) + "]")
+        except Exception as e:
+            # The socket is unusable for writes; fail waiters and let the reader wind down
+            self._fail_pending(e)
+            try:
+                await self.ws.close()
+            except Exception:
+                pass
+
+    async def _read_loop(self):
+        """Route each response to the request with the same request_id."""
+        error: BaseException = ConnectionError("WebSocket connection closed")
+        try:
+            async for message in self.ws:
+                try:
+                    request_id = _loads(message).get("request_id")
+                except (ValueError, AttributeError):
+                    request_id = None
+                future = self.pending.pop(request_id, None)
+                if future is None:
+                    logger.warning("Dropping WebSocket response without a pending request_id: %.200r", message)
+                elif not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            error = e
+        finally:
+            # Nothing more will arrive on this socket; fail whatever is still waiting
+            self._fail_pending(error)
+
+    async def request(self, request_data: str, timeout: float = MUX_RESPONSE_TIMEOUT) -> str:
+        """
+        Send one request tagged with a fresh request_id and await its response.
+        Raises RateLimitedError if no in-flight slot frees up within MUX_ADMIT_TIMEOUT.
+        """
+        try:
+            await asyncio.wait_for(self.inflight.acquire(), MUX_ADMIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RateLimitedError(f"{MUX_MAX_INFLIGHT} requests already in flight") from None
+        request_id = secrets.token_hex(8)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            # request_data is a JSON object; splice the correlation id in before its closing brace
+            payload = f'{request_data[:-1]},"request_id":"{request_id}"}}'
+            if self.outbox is not None:
+                try:
+                    self.outbox.put_nowait(payload)
+                except asyncio.QueueFull:
+                    raise RateLimitedError("Outbound queue is full") from None
+            else:
+                await self.ws.send(payload)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(request_id, None)
+            self.inflight.release()
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.cancel()
+        self.reader.cancel()
+        try:
+            await self.ws.close()
+        except Exception:
+            pass
+
+
+class WSPool:
+    """
+    Process-wide registry of pooled WebSocket connections.
+    Services that talk to the same server with the same token (STT, TTT and
+    TTS in one turn) share a single long-lived connection; a per-connection
+    lock keeps each request/response pair together on it.
+    """
+
+    _conns: Dict[Tuple[str, str], Any] = {}
+    _muxes: Dict[Tuple[str, str], _MuxConnection] = {}
+    _locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    @classmethod
+    def lock(cls, key: Tuple[str, str]) -> asyncio.Lock:
+        """Return the lock guarding the connection for key."""
+        lock = cls._locks.get(key)
+        if lock is None:
+            lock = cls._locks[key] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    async def _connect(server_url: str):
+        if WS_COMPRESSION:
+            # Full window for repetitive JSON keys/text; memLevel 5 halves the
+            # per-connection compressor memory versus zlib's default
+            compression = {"extensions": [permessage_deflate.ClientPerMessageDeflateFactory(
+                server_max_window_bits=15,
+                client_max_window_bits=15,
+                compress_settings={"memLevel": 5},
+            )]}
+        else:
+            compression = {"compression": None}
+        return await websockets.connect(
+            server_url,
+            ping_interval=20,
+            ping_timeout=20,
+            max_size=None,
+            **compression,
+        )
+
+    @classmethod
+    async def get(cls, key: Tuple[str, str], server_url: str):
+        """Return the pooled connection for key, opening it if needed (call with the lock held)."""
+        ws = cls._conns.get(key)
+        if ws is None:
+            ws = cls._conns[key] = await cls._connect(server_url)
+        return ws
+
+    @classmethod
+    async def get_mux(cls, key: Tuple[str, str], server_url: str, batch_window: float = 0.0) -> _MuxConnection:
+        """
+        Return the multiplexed connection for key, (re)opening it if it has stopped.
+        batch_window applies when the connection is (re)opened.
+        """
+        mux = cls._muxes.get(key)
+        if mux is None or not mux.alive:
+            async with cls.lock(key):
+                mux = cls._muxes.get(key)
+                if mux is None or not mux.alive:
+                    mux = cls._muxes[key] = _MuxConnection(await cls._connect(server_url), batch_window)
+        return mux
+
+    @classmethod
+    async def reset(cls, key: Tuple[str, str]):
+        """Drop (and close) the pooled connection for key so the next request reconnects."""
+        ws = cls._conns.pop(key, None)
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+        mux = cls._muxes.pop(key, None)
+        if mux is not None:
+            await mux.close()
+
 
 class SocketService(ABC):
     """
@@ -22,7 +262,17 @@ class SocketService(ABC):
     retry logic, and request handling.
     """
 
-    def __init__(self, server_url: str, token: str, model_id: str):
+    # JSON key that carries the per-request payload for this model
+    payload_key = "text"
+
+    def __init__(
+        self,
+        server_url: str,
+        token: str,
+        model_id: str,
+        multiplex: bool = False,
+        batch_window: float = 0.0,
+    ):
         """
         Initialize the SocketService with the server URL and authentication token.
 
@@ -30,16 +280,61 @@ class SocketService(ABC):
             server_url (str): WebSocket server URL.
             token (str): Authentication token for the server.
             model_id (str): The model identifier (whisper, llama, xtts).
+            multiplex (bool): Overlap concurrent requests on one connection,
+                matching responses by an echoed "request_id" (the server must
+                echo it back).
+            batch_window (float): With multiplex, coalesce requests issued
+                within this many seconds into one JSON-array frame (0 = off;
+                the server must accept array frames).
         """
         self.server_url = server_url
         self.token = token
         self.model_id = model_id
+        self.multiplex = multiplex
+        self.batch_window = batch_window
         self.prompt_id = 123  # Initial prompt_id value
+        # Connection shared (via WSPool) with other services for the same server and token
+        self._pool_key = (server_url, token)
+        # Constant head of every request's JSON, up to the payload value; only the
+        # payload and prompt_id vary
+        self._json_prefix = (
+            '{"token":' + _dumps(token) + ',"model_id":' + _dumps(model_id)
+            + ',' + _dumps(self.payload_key) + ':'
+        )
+
+    async def _exchange(self, request_data: str) -> str:
+        """Send one request on the pooled connection and await its response."""
+        key = self._pool_key
+        if self.multiplex:
+            mux = await WSPool.get_mux(key, self.server_url, self.batch_window)
+            return await mux.request(request_data)
+        async with WSPool.lock(key):
+            try:
+                try:
+                    websocket = await WSPool.get(key, self.server_url)
+                    await websocket.send(request_data)
+                    return await websocket.recv()
+                except websockets.ConnectionClosed:
+                    # Pooled connection went stale (idle timeout, server restart): reconnect once right away
+                    await WSPool.reset(key)
+                    websocket = await WSPool.get(key, self.server_url)
+                    await websocket.send(request_data)
+                    return await websocket.recv()
+            except BaseException:
+                # A failed or cancelled exchange may leave a response in flight; never reuse that socket
+                await WSPool.reset(key)
+                raise
+
+    async def aclose(self):
+        """Close the pooled WebSocket connection (call on shutdown)."""
+        async with WSPool.lock(self._pool_key):
+            await WSPool.reset(self._pool_key)
 
     async def _send_request(self, data: str) -> str:
         """
         Common method to send a WebSocket request and receive the response from the server.
-        This method handles retry logic and connection management.
+        This method handles retry logic and connection management; the
+        connection is kept open and reused by later requests.
 
         Args:
             data (str): The input data (text, prompt, or audio path).
@@ -47,31 +342,38 @@ class SocketService(ABC):
         Returns:
             str: The response from the server.
         """
-        retries = 3  # Number of retries for reconnecting
-        delay = 2  # Delay between retries (in seconds)
+        retries = RETRY_ATTEMPTS
 
         for attempt in range(retries):
             try:
-                logger.info(f"Attempt {attempt + 1}/{retries} to connect to WebSocket for {self.model_id.upper()}...")
-                async with websockets.connect(self.server_url) as websocket:
-                    # Prepare the request data
-                    request_data = self._prepare_request_data(data)
-                    logger.debug(f"Sending {self.model_id.upper()} request: {request_data}")
-                    
-                    # Send the request data
-                    await websocket.send(request_data)
-
-                    # Await the server's response
-                    response = await websocket.recv()
-                    logger.info(f"{self.model_id.upper()} Response: {response}")
-                    return response
-            except Exception as e:
-                logger.error(f"WebSocket error in {self.model_id.upper()} request: {e}, attempt {attempt + 1}/{retries}")
+                # Prepare the request data
+                request_data = self._prepare_request_data(data)
+                # Payload/response logging is DEBUG-only and skipped entirely when disabled
+                debug = logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug("Attempt %d/%d: sending %s request: %s", attempt + 1, retries, self.model_id.upper(), request_data)
+
+                response = await self._exchange(request_data)
+                if debug:
+                    logger.debug("%s Response: %s", self.model_id.upper(), response)
+                return response
+            except RateLimitedError as e:
+                # Load shedding, not a fault: surface it to the caller instead of retrying into the backlog
+                logger.warning("%s request rejected: %s", self.model_id.upper(), e)
+                raise
+            except _TRANSIENT_ERRORS as e:
+                logger.error("WebSocket error in %s request: %s, attempt %d/%d", self.model_id.upper(), e, attempt + 1, retries)
                 if attempt < retries - 1:
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    # Non-blocking capped exponential backoff; jitter keeps clients from reconnecting in lockstep
+                    backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)) * (1 + random.random() * RETRY_JITTER)
+                    logger.info("Retrying in %.1f seconds...", backoff)
+                    await asyncio.sleep(backoff)
                 else:
                     raise
+            except Exception as e:
+                # Not transient (e.g. invalid input): retrying cannot help
+                logger.error("%s request failed: %s", self.model_id.upper(), e)
+                raise
         # If all attempts fail
         raise Exception(f"Failed to connect to WebSocket after {retries} attempts.")
 
@@ -100,15 +402,19 @@ class STTService(SocketService):
     This class manages connections to the server for STT operations independently.
     """
 
-    def __init__(self, server_url: str, token: str):
+    def __init__(self, server_url: str, token: str, multiplex: bool = False, batch_window: float = 0.0):
         """
         Initialize the STTService with the server URL and authentication token.
 
         Args:
             server_url (str): WebSocket server URL.
             token (str): Authentication token for the server.
+            multiplex (bool): Overlap concurrent requests on one connection.
+            batch_window (float): With multiplex, batch requests within this window (seconds).
         """
-        super().__init__(server_url, token, "whisper")
+        super().__init__(server_url, token, "whisper", multiplex, batch_window)
+        # Last validated audio path; recordings are usually written to the same path
+        self._checked_path = None
 
     def _prepare_request_data(self, audio_file_path: str) -> str:
         """
@@ -120,15 +426,13 @@ class STTService(SocketService):
         Returns:
             str: The JSON string representing the request data.
         """
-        if not os.path.exists(audio_file_path):  # Validate the audio file path
-            raise ValueError(f"Audio file path '{audio_file_path}' does not exist or is invalid.")
+        if audio_file_path != self._checked_path:  # Validate the audio file path (once per distinct path)
+            if not os.path.exists(audio_file_path):
+                raise ValueError(f"Audio file path '{audio_file_path}' does not exist or is invalid.")
+            self._checked_path = audio_file_path
         
-        return json.dumps({
-            "token": self.token,
-            "model_id": self.model_id,
-            "text": audio_file_path,  # For Whisper, data is audio path
-            "prompt_id": self.prompt_id
-        })
+        # For Whisper, data is audio path
+        return f'{self._json_prefix}{_dumps(audio_file_path)},"prompt_id":{self.prompt_id}}}'
 
     async def stt_request(self, audio_file_path: str) -> str:
         """
@@ -140,7 +444,7 @@ class STTService(SocketService):
         Returns:
             str: The transcribed text response from the server.
         """
-        logger.info("Sending STT request to Whisper model...")
+        logger.debug("Sending STT request to Whisper model...")
         response = await self._send_request(audio_file_path)
         self._increment_prompt_id()
         return response
@@ -152,15 +456,19 @@ class TTTService(SocketService):
     This class manages connections to the server for TTT operations independently.
     """
 
-    def __init__(self, server_url: str, token: str):
+    payload_key = "prompt"
+
+    def __init__(self, server_url: str, token: str, multiplex: bool = False, batch_window: float = 0.0):
         """
         Initialize the TTTService with the server URL and authentication token.
 
         Args:
             server_url (str): WebSocket server URL.
             token (str): Authentication token for the server.
+            multiplex (bool): Overlap concurrent requests on one connection.
+            batch_window (float): With multiplex, batch requests within this window (seconds).
         """
-        super().__init__(server_url, token, "llama")
+        super().__init__(server_url, token, "llama", multiplex, batch_window)
 
     def _prepare_request_data(self, prompt: str) -> str:
         """
@@ -172,12 +480,8 @@ class TTTService(SocketService):
         Returns:
             str: The JSON string representing the request data.
         """
-        return json.dumps({
-            "token": self.token,
-            "model_id": self.model_id,
-            "prompt": prompt,  # For Llama, data is a text prompt
-            "prompt_id": self.prompt_id
-        })
+        # For Llama, data is a text prompt
+        return f'{self._json_prefix}{_dumps(prompt)},"prompt_id":{self.prompt_id}}}'
 
     async def ttt_request(self, prompt: str) -> str:
         """
@@ -189,7 +493,7 @@ class TTTService(SocketService):
         Returns:
             str: The text response from the server.
         """
-        logger.info("Sending TTT request to Llama model...")
+        logger.debug("Sending TTT request to Llama model...")
         response = await self._send_request(prompt)
         self._increment_prompt_id()
         return response
@@ -201,15 +505,17 @@ class TTSService(SocketService):
     This class manages connections to the server for TTS operations independently.
     """
 
-    def __init__(self, server_url: str, token: str):
+    def __init__(self, server_url: str, token: str, multiplex: bool = False, batch_window: float = 0.0):
         """
         Initialize the TTSService with the server URL and authentication token.
 
         Args:
             server_url (str): WebSocket server URL.
             token (str): Authentication token for the server.
+            multiplex (bool): Overlap concurrent requests on one connection.
+            batch_window (float): With multiplex, batch requests within this window (seconds).
         """
-        super().__init__(server_url, token, "xtts")
+        super().__init__(server_url, token, "xtts", multiplex, batch_window)
 
     def _prepare_request_data(self, text: str) -> str:
         """
@@ -221,12 +527,8 @@ class TTSService(SocketService):
         Returns:
             str: The JSON string representing the request data.
         """
-        return json.dumps({
-            "token": self.token,
-            "model_id": self.model_id,
-            "text": text,  # For XTTS, data is text to convert to speech
-            "prompt_id": self.prompt_id
-        })
+        # For XTTS, data is text to convert to speech
+        return f'{self._json_prefix}{_dumps(text)},"prompt_id":{self.prompt_id}}}'
 
     async def tts_request(self, text: str) -> str:
         """
@@ -238,12 +540,78 @@ class TTSService(SocketService):
         Returns:
             str: The audio response from the server.
         """
-        logger.info("Sending TTS request to XTTS model...")
+        logger.debug("Sending TTS request to XTTS model...")
         response = await self._send_request(text)
         self._increment_prompt_id()
         return response
 
 
+class SyncSocketService:
+    """
+    Blocking front end for a SocketService, for single-consumer scripts.
+    Reuses the wrapped service's request format and prompt_id but talks over
+    one websocket-client connection, skipping the event loop and per-frame
+    UTF-8 validation. Only worth it when requests are strictly sequential;
+    for concurrent callers use the async services (multiplex=True).
+
+    Example:
+        tts = SyncSocketService(TTSService(server_url, token))
+        audio = tts.request("Hello")
+    """
+
+    def __init__(self, service: SocketService):
+        """
+        Args:
+            service (SocketService): Service whose URL, token and payload format to use.
+        """
+        if _ws_client is None:
+            raise ImportError("SyncSocketService requires the websocket-client package (pip install websocket-client)")
+        self.service = service
+        self._ws = None
+
+    def _connect(self):
+        if self._ws is None:
+            self._ws = _ws_client.create_connection(self.service.server_url, skip_utf8_validation=True)
+        return self._ws
+
+    def request(self, data: str) -> str:
+        """
+        Send one request and block until its response arrives.
+
+        Args:
+            data (str): The input data (text, prompt, or audio path).
+
+        Returns:
+            str: The response from the server.
+        """
+        request_data = self.service._prepare_request_data(data)
+        try:
+            ws = self._connect()
+            try:
+                ws.send(request_data)
+            except _ws_client.WebSocketConnectionClosedException:
+                # Idle connection went stale: reconnect once
+                self.close()
+                ws = self._connect()
+                ws.send(request_data)
+            response = ws.recv()
+        except BaseException:
+            # Never reuse a socket that may still have a response in flight
+            self.close()
+            raise
+        self.service._increment_prompt_id()
+        return response
+
+    def close(self):
+        """Close the connection (reopened on the next request)."""
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+
+
 # Main execution: Example usage
 async def main():
     """
@@ -281,4 +649,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # Optional (not available on Windows); default asyncio loop otherwise
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
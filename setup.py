@@ -64,6 +64,7 @@ setup(
         
         # HTTP & Networking
         "requests>=2.32.0",
+        "uvloop>=0.18.0; sys_platform != 'win32'",  # Faster asyncio event loop
         
         # Hugging Face Ecosystem (for model management)
         "huggingface-hub>=0.24.0",
@@ -89,14 +89,10 @@ class STTPersistentClient:
                     print("❌ STT connection failed, cannot send request")
                     return None, time.time() - start_time
 
-                request = {
-                    "model_id": "whisper",
-                    "prompt": audio_b64,
-                    "prompt_id": prompt_id,
-                    "language": "en",
-                }
-
-                await asyncio.wait_for(self.ws.send(json.dumps(request)), timeout=5.0)
+                # Base64 never needs JSON escaping, so splice it in rather than json.dumps-scanning it
+                request = f'{{"model_id":"whisper","prompt":"{audio_b64}","prompt_id":{prompt_id},"language":"en"}}'
+
+                await asyncio.wait_for(self.ws.send(request), timeout=5.0)
 
                 response = await asyncio.wait_for(self.ws.recv(), timeout=15.0)
                 response_data = json.loads(response)
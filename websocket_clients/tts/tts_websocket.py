@@ -1,16 +1,58 @@
 import asyncio
 import base64
+import io
 import json
-import os
 import re
 import subprocess
-import tempfile
 import time
 from pathlib import Path
 from typing import Optional, Tuple
 
 import websockets
 
+from services.utility.voice_reference_utils import fix_wav_sizes
+
+try:
+    import soundfile as sf
+except ImportError:  # Optional; ffprobe/ffmpeg subprocesses are used otherwise
+    sf = None
+
+# Trimmed voice reference: first 5 seconds as 16 kHz mono 16-bit PCM WAV
+TRIM_SECONDS = 5
+TRIM_SAMPLE_RATE = 16000
+
+
+def _duration_in_process(input_path: str) -> Optional[float]:
+    """Duration from the file header via libsndfile, or None if it cannot read the format"""
+    if sf is None:
+        return None
+    try:
+        return sf.info(input_path).duration
+    except Exception:
+        return None
+
+
+def _trim_in_process(input_path: str) -> Optional[bytes]:
+    """
+    Decode, trim, downmix and resample in-process, returning WAV bytes.
+    Returns None when libsndfile cannot read the format (ffmpeg handles those).
+    """
+    if sf is None:
+        return None
+    try:
+        with sf.SoundFile(input_path) as f:
+            sr = f.samplerate
+            audio = f.read(frames=TRIM_SECONDS * sr, dtype="float32", always_2d=True)
+        audio = audio.mean(axis=1)
+        if sr != TRIM_SAMPLE_RATE:
+            import librosa  # Heavy import, only needed when resampling
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=TRIM_SAMPLE_RATE)
+        buf = io.BytesIO()
+        sf.write(buf, audio, TRIM_SAMPLE_RATE, subtype="PCM_16", format="WAV")
+        return buf.getvalue()
+    except Exception:
+        return None
+
 
 def get_audio_duration(input_path: str) -> Optional[float]:
     try:
@@ -29,32 +71,33 @@ def get_audio_duration(input_path: str) -> Optional[float]:
         return None
 
 
-def trim_to_5_seconds(input_path: str, output_path: str) -> bool:
+def trim_to_5_seconds(input_path: str) -> Optional[bytes]:
+    """Trim with ffmpeg, capturing the WAV from stdout (no temp file); None on failure"""
     try:
         cmd = [
             "ffmpeg",
-            "-y",
+            "-hide_banner", "-loglevel", "error",
             "-i", input_path,
-            "-t", "5",
-            "-ar", "16000",
+            "-t", str(TRIM_SECONDS),
+            "-ar", str(TRIM_SAMPLE_RATE),
             "-ac", "1",
             "-acodec", "pcm_s16le",
             "-map_metadata", "-1",
-            output_path,
+            "-f", "wav",
+            "pipe:1",
         ]
         print("  ↳ Trimming voice reference to 5 seconds...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"  ✓ Voice reference trimmed: {output_path}")
-            return True
-        print(f"  ✗ FFmpeg error: {result.stderr}")
-        return False
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode == 0 and result.stdout:
+            return bytes(fix_wav_sizes(bytearray(result.stdout)))
+        print(f"  ✗ FFmpeg error: {result.stderr.decode('utf-8', 'replace')}")
+        return None
     except FileNotFoundError:
         print("  ✗ Error: ffmpeg not found. Please install ffmpeg.")
-        return False
+        return None
     except Exception as e:
         print(f"  ✗ Error: {e}")
-        return False
+        return None
 
 
 def process_audio_file_for_voice_reference(input_path: str) -> Tuple[Optional[bytes], bool]:
@@ -65,7 +108,9 @@ def process_audio_file_for_voice_reference(input_path: str) -> Tuple[Optional[by
     try:
         file_size_bytes = Path(input_path).stat().st_size
         file_size_kb = file_size_bytes / 1024
-        duration = get_audio_duration(input_path) or 0.0
+        duration = _duration_in_process(input_path)
+        if duration is None:
+            duration = get_audio_duration(input_path) or 0.0
 
         print(f"  ↳ Voice reference file: {file_size_kb:.1f}KB, {duration:.1f}s")
 
@@ -77,20 +122,17 @@ def process_audio_file_for_voice_reference(input_path: str) -> Tuple[Optional[by
 
         print(f"  ⚠️  Voice reference needs trimming (size: {file_size_kb:.1f}KB, duration: {duration:.1f}s)")
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            temp_output = tmp.name
+        # Formats libsndfile reads (WAV, FLAC, OGG, ...) never leave the process
+        audio_bytes = _trim_in_process(input_path)
+        if audio_bytes is not None:
+            print(f"  ✓ Trimmed to: {len(audio_bytes) / 1024:.1f}KB")
+            return audio_bytes, True
 
-        success = trim_to_5_seconds(input_path, temp_output)
-        if not success:
+        audio_bytes = trim_to_5_seconds(input_path)
+        if audio_bytes is None:
             print("  ⚠️  Trimming failed, using original file (may cause issues)")
             return Path(input_path).read_bytes(), False
 
-        audio_bytes = Path(temp_output).read_bytes()
-        try:
-            os.unlink(temp_output)
-        except Exception:
-            pass
-
         trimmed_kb = len(audio_bytes) / 1024
         print(f"  ✓ Trimmed to: {trimmed_kb:.1f}KB")
         return audio_bytes, True
@@ -117,6 +159,8 @@ class XTTSPersistentClient:
         self.voice_reference_b64 = None
         self.voice_reference_loaded = False
         self.voice_reference_trimmed = False
+        # Constant tail of every request's JSON; carries the (large) voice reference once loaded
+        self._request_suffix = ',"language":"en"}'
 
         if self.voice_clone_path:
             self._preload_voice_reference()
@@ -137,6 +181,11 @@ class XTTSPersistentClient:
             self.voice_reference_trimmed = trimmed
             self.voice_reference_b64 = base64.b64encode(audio_bytes).decode("ascii")
             self.voice_reference_loaded = True
+            # Serialized once here instead of re-encoding ~100KB of base64 on every request
+            self._request_suffix = (
+                ',"language":"en","voice_cloning":true,"voice_reference":"'
+                + self.voice_reference_b64 + '"}'
+            )
 
             b64_size_kb = len(self.voice_reference_b64) / 1024
             audio_size_kb = len(audio_bytes) / 1024
@@ -221,20 +270,13 @@ class XTTSPersistentClient:
                     print("❌ XTTS connection failed, cannot send request")
                     return None, time.time() - start_time
 
-                request = {
-                    "model_id": "xtts",
-                    "prompt": text_clean,
-                    "prompt_id": prompt_id,
-                    "language": "en",
-                }
+                request = f'{{"model_id":"xtts","prompt":{json.dumps(text_clean)},"prompt_id":{prompt_id}{self._request_suffix}'
 
                 if self.voice_reference_loaded:
-                    request["voice_cloning"] = True
-                    request["voice_reference"] = self.voice_reference_b64
                     voice_status = "trimmed to 5s" if self.voice_reference_trimmed else "original"
                     print(f"🎤 Voice cloning enabled ({voice_status})")
 
-                await asyncio.wait_for(self.ws.send(json.dumps(request)), timeout=5.0)
+                await asyncio.wait_for(self.ws.send(request), timeout=5.0)
                 response = await asyncio.wait_for(self.ws.recv(), timeout=30.0)
 
                 response_data = json.loads(response)